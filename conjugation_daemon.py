@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Conjugation daemon for the French conjugation tool
+Keeps a verbecc Conjugator warm behind a Unix socket so repeated cj calls
+skip loading verbecc's models on every invocation
+Requests are {"verb": ...} or {"batch": [...]} for several verbs in one round trip
+Usage:
+  cjd                          # Run the daemon in the foreground
+  (cj starts it automatically in the background when needed)
+"""
+
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+
+SOCKET_PATH = Path.home() / '.cache' / 'french-tools' / 'cj.sock'
+IDLE_TIMEOUT = 30 * 60      # Exit after 30 minutes without requests
+STARTUP_TIMEOUT = 30        # Seconds to wait for a freshly started daemon
+REQUEST_TIMEOUT = 30        # Seconds to wait for a reply (covers verbecc warm-up)
+
+def _send_message(sock, payload):
+    """Send one length-prefixed JSON message"""
+    data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+    sock.sendall(struct.pack('>I', len(data)) + data)
+
+def _recv_exact(sock, size):
+    """Read exactly size bytes from the socket"""
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("Connection closed mid-message")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+def _recv_message(sock):
+    """Receive one length-prefixed JSON message"""
+    (length,) = struct.unpack('>I', _recv_exact(sock, 4))
+    return json.loads(_recv_exact(sock, length).decode('utf-8'))
+
+def _connect():
+    """Connect to a running daemon"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(REQUEST_TIMEOUT)
+    try:
+        sock.connect(str(SOCKET_PATH))
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+def _start_daemon():
+    """Start the daemon in the background and wait until it accepts connections"""
+    # Run from the cache directory so verbecc's log files land there
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__)],
+        cwd=SOCKET_PATH.parent,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+    
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            return _connect()
+        except (FileNotFoundError, ConnectionRefusedError):
+            time.sleep(0.1)
+    return None
+
+def request(payload):
+    """Send a request to the daemon, starting it if needed; return the reply or None if unavailable"""
+    if not hasattr(socket, 'AF_UNIX') or os.environ.get('CJ_NO_DAEMON'):
+        return None
+    
+    try:
+        try:
+            sock = _connect()
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock = _start_daemon()
+            if sock is None:
+                return None
+        
+        with sock:
+            _send_message(sock, payload)
+            return _recv_message(sock)
+    except (OSError, ValueError, struct.error):
+        return None
+
+def conjugate(verb):
+    """Conjugate a verb through the daemon; return None if the daemon is unavailable"""
+    reply = request({'verb': verb})
+    if reply is None:
+        return None
+    if 'error' in reply:
+        raise ValueError(reply['error'])
+    return reply['result']
+
+def conjugate_many(verbs):
+    """Conjugate several verbs in one daemon round trip
+    
+    Returns a list aligned with verbs holding each result, or None for verbs
+    that failed; returns None altogether if the daemon is unavailable.
+    """
+    reply = request({'batch': list(verbs)})
+    # A reply the daemon could not encode comes back as a single error
+    if reply is None or 'error' in reply:
+        return None
+    return [item.get('result') for item in reply['results']]
+
+def serve():
+    """Run the daemon until it has been idle for IDLE_TIMEOUT seconds"""
+    SOCKET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Leave an already running daemon alone. Only a refused connection shows the
+    # socket file is stale; a missing one leaves nothing to clear
+    try:
+        _connect().close()
+        return
+    except FileNotFoundError:
+        pass
+    except ConnectionRefusedError:
+        try:
+            SOCKET_PATH.unlink()
+        except FileNotFoundError:
+            pass
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # The socket file is created owner-only, with no window under the default umask
+    old_umask = os.umask(0o077)
+    try:
+        server.bind(str(SOCKET_PATH))
+        # Identifies our socket file: a daemon started after this one found it
+        # stale may have replaced it by the time this one exits
+        bound_inode = SOCKET_PATH.stat().st_ino
+    except OSError:
+        # Another daemon bound it first
+        server.close()
+        return
+    finally:
+        os.umask(old_umask)
+    
+    try:
+        server.listen()
+        server.settimeout(IDLE_TIMEOUT)
+        
+        # Clients may connect while verbecc loads; they wait in the listen backlog.
+        # If it fails to load, the finally below removes the socket and drops them
+        from verbecc import Conjugator
+        cg = Conjugator(lang='fr')
+        
+        @lru_cache(maxsize=512)
+        def conjugate_cached(verb):
+            return cg.conjugate(verb)
+        
+        def handle(verb):
+            try:
+                return {'result': conjugate_cached(verb)}
+            except Exception as e:
+                return {'error': str(e)}
+        
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            
+            with conn:
+                conn.settimeout(REQUEST_TIMEOUT)
+                try:
+                    message = _recv_message(conn)
+                    if 'batch' in message:
+                        reply = {'results': [handle(verb) for verb in message['batch']]}
+                    else:
+                        reply = handle(message['verb'])
+                    try:
+                        _send_message(conn, reply)
+                    except (TypeError, ValueError) as e:
+                        # The reply is encoded before anything is sent, so an error frame can follow
+                        _send_message(conn, {'error': f"Could not encode reply: {e}"})
+                except (OSError, ValueError, KeyError, struct.error):
+                    continue
+    finally:
+        server.close()
+        # Remove the socket file only if it is still the one bound here
+        try:
+            if SOCKET_PATH.stat().st_ino == bound_inode:
+                SOCKET_PATH.unlink()
+        except FileNotFoundError:
+            pass
+
+if __name__ == "__main__":
+    serve()
@@ -6,24 +6,39 @@ Usage:
   cj [verb]                    # All conjugations
   cj [person] [verb]           # All tenses for a person  
   cj [person] [verb] [tense]   # Specific person+tense
+  cj --batch [file]            # All conjugations for each verb in a file
+  cj --plain [verb]            # All conjugations as plain lines (fast, script-friendly)
 """
 
+import argparse
+import json
+import os
 import sys
-from verbecc import Conjugator
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
 from rich.console import Console
-from rich.table import Table
-from rich import box
-from rich.text import Text
-from rich.panel import Panel
 from tool_cache import ToolCache, show_all_cache_stats, clear_all_caches, cleanup_expired_all
+from tool_io import read_word_list
+import conjugation_daemon
 
 console = Console()
 
 # Initialize conjugation cache
-conj_cache = ToolCache('conjugation', max_age_days=30)  # Cache for 30 days
+conj_cache = ToolCache('conjugation', max_age_days=90)  # Conjugations never change; cache for 90 days
 
-# Initialize French conjugator
-cg = Conjugator(lang='fr')
+# French conjugator, created on first use: loading verbecc's models dominates
+# startup, and help/aliases/cache commands never need it
+_cg = None
+
+def get_cg():
+    """Return the shared verbecc conjugator, initializing it on first call"""
+    global _cg
+    if _cg is None:
+        from verbecc import Conjugator
+        _cg = Conjugator(lang='fr')
+    return _cg
 
 # Predefined persons and their variations
 PERSONS = {
@@ -160,219 +175,283 @@ PERSON_MAPPING = {
     'ils': '3p'
 }
 
+# Position of each person in verbecc's conjugation lists
+PERSON_INDEX = MappingProxyType({person: i for i, person in enumerate(['je', 'tu', 'il', 'nous', 'vous', 'ils'])})
+IMP_INDEX = MappingProxyType({'tu': 0, 'nous': 1, 'vous': 2})
+
+# How each verbecc tense key is laid out: imperative (tu/nous/vous),
+# impersonal (infinitives and participles) or regular (six persons)
+TENSE_KIND = MappingProxyType({
+    tense_info['tense']: ('imp' if 'imperatif' in tense_info['tense']
+                          else 'impersonal' if ('infinitif' in tense_info['tense'] or 'participe' in tense_info['tense'])
+                          else 'regular')
+    for tense_info in TENSES.values()
+})
+
+# Table rows for each tense kind in the all-conjugations view
+ROW_BUILDERS = {
+    'imp': lambda tense_data: zip(IMP_INDEX, tense_data),
+    'impersonal': lambda tense_data: (("—", conjugated_form) for conjugated_form in tense_data),
+    'regular': lambda tense_data: zip(PERSON_INDEX, tense_data),
+}
+
+# Folds accents and curly apostrophes out of lowercased input in one C-level
+# str.translate pass, so 'présent', 'present' and 'PRÉSENT' are the same key.
+# Combining marks are dropped too, which covers decomposed (NFD) input
+# as typed on some macOS terminals.
+ACCENT_TABLE = str.maketrans({
+    **{accented: plain
+       for plain, accents in (('a', 'àâä'), ('e', 'éèêë'), ('i', 'îï'), ('o', 'ôö'),
+                              ('u', 'ùûü'), ('y', 'ÿ'), ('c', 'ç'))
+       for accented in accents},
+    'œ': 'oe', 'æ': 'ae',
+    '\u2019': "'",
+    **{chr(mark): None for mark in range(0x300, 0x370)},
+})
+
+def fold(text):
+    """Lowercase and strip accents for alias matching"""
+    return text.lower().translate(ACCENT_TABLE)
+
+# Flattened alias lookups, built once since the tables above never change.
+# Keys are folded, so accented and unaccented spellings share an entry, and
+# interned so lookups with interned input compare by identity.
+ALIAS_TO_TENSE = MappingProxyType({sys.intern(fold(alias)): standard
+                                   for standard, tense_info in TENSES.items()
+                                   for alias in tense_info['aliases']})
+PERSON_LOOKUP = MappingProxyType({sys.intern(fold(variation)): standard
+                                  for standard, variations in PERSONS.items()
+                                  for variation in variations})
+
 def normalize_person(person_input):
     """Normalize person input to standard form"""
-    person_input = person_input.lower().strip()
-    for standard, variations in PERSONS.items():
-        if person_input in variations:
-            return standard
-    return None
+    return PERSON_LOOKUP.get(sys.intern(fold(person_input.strip())))
 
 def normalize_tense(tense_input):
     """Normalize tense input to standard form"""
-    tense_input = tense_input.lower().strip()
-    for standard, tense_info in TENSES.items():
-        if tense_input in tense_info['aliases']:
-            return standard
-    return None
+    return ALIAS_TO_TENSE.get(sys.intern(fold(tense_input.strip())))
+
+# Tenses shown without a person (participles and infinitives)
+IMPERSONAL_TENSES = frozenset(standard for standard, tense_info in TENSES.items()
+                              if 'participe' in tense_info['mood'] or 'infinitif' in tense_info['mood'])
+
+def _classify(token):
+    """Classify a command-line token as ('P', person), ('T', tense) or ('V', token)"""
+    key = sys.intern(fold(token.strip()))
+    person = PERSON_LOOKUP.get(key)
+    if person:
+        return ('P', person)
+    tense = ALIAS_TO_TENSE.get(key)
+    if tense:
+        return ('T', tense)
+    return ('V', token)
+
+class ConjError(Exception):
+    """A conjugation request that cannot be answered; the message is shown as-is"""
+
+@contextmanager
+def _report():
+    """Print a ConjError raised by a display function instead of a traceback"""
+    try:
+        yield
+    except ConjError as e:
+        console.print(f"[bold red]❌ {e}[/bold red]")
+
+@lru_cache(maxsize=512)
+def _conjugate_cached(verb):
+    """Conjugate a verb with verbecc, memoized for the lifetime of the process"""
+    # Prefer the warm daemon; load verbecc in-process only if it is unavailable
+    result = conjugation_daemon.conjugate(verb)
+    if result is None:
+        # Round-trip through JSON so verbecc's enum keys become plain strings, as
+        # the daemon returns them; cached entries then never need verbecc to load
+        result = json.loads(json.dumps(get_cg().conjugate(verb)))
+    return result
+
+@lru_cache(maxsize=128)
+def _get_full(verb):
+    """Get the full verbecc conjugation for a verb, cached under one key for every display mode"""
+    result = conj_cache.get(verb, 'all')
+    if result:
+        return result
+    
+    # verbecc is the only thing here that fails on bad input (unknown verbs,
+    # daemon errors); everything downstream is plain dict access
+    try:
+        result = _conjugate_cached(verb)
+    except Exception as e:
+        raise ConjError(f"Error conjugating '{verb}': {e}") from e
+    
+    if result:
+        conj_cache.set(result, verb, 'all')
+    return result
+
+def _fetch(verb):
+    """Fetch a verb's full conjugation, raising ConjError if there is none"""
+    result = _get_full(verb)
+    if not result or 'moods' not in result:
+        raise ConjError("No conjugations found")
+    
+    return result
 
 def get_conjugation(verb, mood, tense, person=None):
     """Get conjugation using verbecc"""
     try:
-        conjugation = cg.conjugate(verb)
-        
-        if mood in conjugation and tense in conjugation[mood]:
-            if person:
-                person_key = PERSON_MAPPING.get(person)
-                if person_key in conjugation[mood][tense]:
-                    return conjugation[mood][tense][person_key]
-                return None
-            else:
-                return conjugation[mood][tense]
-        return None
-    except Exception as e:
-        console.print(f"[bold red]❌ Error conjugating '{verb}': {e}[/bold red]")
+        conjugation = _fetch(verb)['moods']
+    except ConjError as e:
+        console.print(f"[bold red]❌ {e}[/bold red]")
         return None
+    
+    if mood in conjugation and tense in conjugation[mood]:
+        if person:
+            person_key = PERSON_MAPPING.get(person)
+            if person_key in conjugation[mood][tense]:
+                return conjugation[mood][tense][person_key]
+            return None
+        else:
+            return conjugation[mood][tense]
+    return None
 
-def display_all_conjugations(verb):
-    """Display all conjugations for a verb"""
-    # Check cache first
-    cached_result = conj_cache.get(verb, 'all')
-    if cached_result:
-        result = cached_result
+def render_plain(result, verb, color):
+    """Render all conjugations as plain lines, ANSI-colored if color is set"""
+    if color:
+        mood_on, tense_on, person_on, form_on, dim_on, off = (
+            '\x1b[1;35m', '\x1b[1;36m', '\x1b[36m', '\x1b[32m', '\x1b[2m', '\x1b[0m')
     else:
-        try:
-            result = cg.conjugate(verb)
+        mood_on = tense_on = person_on = form_on = dim_on = off = ''
+    
+    lines = []
+    for mood_name, mood_data in result['moods'].items():
+        if isinstance(mood_data, dict):
+            lines.append(f"\n{mood_on}═══ {mood_name.upper()} ═══{off}")
             
-            # Cache the result
-            if result:
-                conj_cache.set(result, verb, 'all')
-        except Exception as e:
-            console.print(f"[bold red]❌ Error conjugating '{verb}': {e}[/bold red]")
-            return
+            for tense_name, tense_data in mood_data.items():
+                if isinstance(tense_data, list) and tense_data:
+                    lines.append(f"{tense_on}{tense_name}{off}")
+                    kind = TENSE_KIND.get(tense_name, 'regular')
+                    for person, form in ROW_BUILDERS[kind](tense_data):
+                        lines.append(f"  {person_on}{person:6}{off} {form_on}{form}{off}")
     
-    try:
-        
-        if not result or 'moods' not in result:
-            console.print("[bold red]❌ No conjugations found[/bold red]")
-            return
-        
-        conjugation = result['moods']
-        
-        # Display each mood and tense
-        for mood_name, mood_data in conjugation.items():
-            if isinstance(mood_data, dict):
-                console.print(f"\n[bold magenta]═══ {mood_name.upper()} ═══[/bold magenta]")
-                
-                for tense_name, tense_data in mood_data.items():
-                    if isinstance(tense_data, list) and tense_data:
-                        table = Table(title=f"[bold cyan]{tense_name}[/bold cyan]", 
-                                     box=box.ROUNDED, show_header=True)
-                        table.add_column("Personne", style="cyan", width=15)
-                        table.add_column("Conjugaison", style="green", width=30)
-                        
-                        # Standard person order for French
-                        persons = ['je', 'tu', 'il', 'nous', 'vous', 'ils']
-                        
-                        # Handle different cases based on tense type
-                        if 'imperatif' in tense_name:
-                            # Imperative has only 3 forms: tu, nous, vous
-                            imp_persons = ['tu', 'nous', 'vous']
-                            for i, conjugated_form in enumerate(tense_data):
-                                if i < len(imp_persons):
-                                    table.add_row(imp_persons[i], conjugated_form)
-                        elif 'infinitif' in tense_name or 'participe' in tense_name:
-                            # Infinitive and participle forms
-                            for conjugated_form in tense_data:
-                                table.add_row("—", conjugated_form)
-                        else:
-                            # Regular conjugation with 6 persons
-                            for i, conjugated_form in enumerate(tense_data):
-                                if i < len(persons):
-                                    table.add_row(persons[i], conjugated_form)
-                        
-                        console.print(table)
-        
-        # Display verb info if available
-        if 'verb' in result:
-            verb_info = result['verb']
-            info_text = f"[dim]Infinitif: {verb_info.get('infinitive', verb)}"
-            if 'translation_en' in verb_info:
-                info_text += f" | EN: {verb_info['translation_en']}"
-            console.print(f"\n{info_text}[/dim]")
+    if 'verb' in result:
+        verb_info = result['verb']
+        info_text = f"Infinitif: {verb_info.get('infinitive', verb)}"
+        if 'translation_en' in verb_info:
+            info_text += f" | EN: {verb_info['translation_en']}"
+        lines.append(f"\n{dim_on}{info_text}{off}")
     
-    except Exception as e:
-        console.print(f"[bold red]❌ Error processing conjugations: {e}[/bold red]")
+    return "\n".join(lines) + "\n"
+
+def display_all_conjugations(verb, plain=False):
+    """Display all conjugations for a verb"""
+    result = _fetch(verb)
+    
+    if plain:
+        # One write of a prebuilt buffer instead of laying out Rich tables
+        color = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+        sys.stdout.write(render_plain(result, verb, color))
+        return
+    
+    from rich.console import Group
+    from rich.table import Table
+    from rich import box
+    
+    # Collect every header and table, then let Rich lay them out in one print
+    renderables = []
+    for mood_name, mood_data in result['moods'].items():
+        if isinstance(mood_data, dict):
+            renderables.append(f"\n[bold magenta]═══ {mood_name.upper()} ═══[/bold magenta]")
+            
+            for tense_name, tense_data in mood_data.items():
+                if isinstance(tense_data, list) and tense_data:
+                    table = Table(title=f"[bold cyan]{tense_name}[/bold cyan]", 
+                                 box=box.ROUNDED, show_header=True)
+                    table.add_column("Personne", style="cyan", width=15)
+                    table.add_column("Conjugaison", style="green", width=30)
+                    
+                    kind = TENSE_KIND.get(tense_name, 'regular')
+                    for row in ROW_BUILDERS[kind](tense_data):
+                        table.add_row(*row)
+                    renderables.append(table)
+    
+    # Display verb info if available
+    if 'verb' in result:
+        verb_info = result['verb']
+        info_text = f"[dim]Infinitif: {verb_info.get('infinitive', verb)}"
+        if 'translation_en' in verb_info:
+            info_text += f" | EN: {verb_info['translation_en']}"
+        renderables.append(f"\n{info_text}[/dim]")
+    
+    console.print(Group(*renderables))
 
 def display_person_conjugations(verb, person):
     """Display all tenses for a specific person"""
-    # Check cache first  
-    cached_result = conj_cache.get(verb, 'person', person)
-    if cached_result:
-        result = cached_result
-    else:
-        try:
-            result = cg.conjugate(verb)
-            
-            # Cache the result
-            if result:
-                conj_cache.set(result, verb, 'person', person)
-        except Exception as e:
-            console.print(f"[bold red]❌ Error conjugating '{verb}': {e}[/bold red]")
-            return
+    from rich.table import Table
+    from rich import box
     
-    try:
-        
-        if not result or 'moods' not in result:
-            console.print("[bold red]❌ No conjugations found[/bold red]")
-            return
-        
-        conjugation = result['moods']
-        
-        table = Table(box=box.ROUNDED, show_header=True)
-        table.add_column("Temps", style="magenta", width=30)
-        table.add_column("Conjugaison", style="green", width=25)
-        
-        persons = ['je', 'tu', 'il', 'nous', 'vous', 'ils']
-        person_index = persons.index(person) if person in persons else -1
-        found_any = False
-        
-        for mood_name, mood_data in conjugation.items():
-            if isinstance(mood_data, dict):
-                for tense_name, tense_data in mood_data.items():
-                    if isinstance(tense_data, list) and tense_data:
-                        conjugated_form = None
-                        
-                        if 'imperatif' in tense_name:
-                            # Imperative: tu=0, nous=1, vous=2
-                            imp_persons = ['tu', 'nous', 'vous']
-                            if person in imp_persons:
-                                imp_index = imp_persons.index(person)
-                                if imp_index < len(tense_data):
-                                    conjugated_form = tense_data[imp_index]
-                        elif 'infinitif' in tense_name or 'participe' in tense_name:
-                            # Skip infinitive/participle for person-specific display
-                            continue
-                        else:
-                            # Regular 6-person conjugation
-                            if person_index != -1 and person_index < len(tense_data):
-                                conjugated_form = tense_data[person_index]
-                        
-                        if conjugated_form:
-                            full_tense_name = f"{mood_name} {tense_name}"
-                            table.add_row(full_tense_name, conjugated_form)
-                            found_any = True
-        
-        if found_any:
-            console.print(table)
-        else:
-            console.print(f"[bold red]❌ No conjugations found for person '{person}'[/bold red]")
+    result = _fetch(verb)
     
-    except Exception as e:
-        console.print(f"[bold red]❌ Error processing conjugations: {e}[/bold red]")
+    table = Table(box=box.ROUNDED, show_header=True)
+    table.add_column("Temps", style="magenta", width=30)
+    table.add_column("Conjugaison", style="green", width=25)
+    
+    person_index = PERSON_INDEX.get(person)
+    imp_index = IMP_INDEX.get(person)
+    found_any = False
+    
+    for mood_name, mood_data in result['moods'].items():
+        if isinstance(mood_data, dict):
+            for tense_name, tense_data in mood_data.items():
+                if isinstance(tense_data, list) and tense_data:
+                    conjugated_form = None
+                    kind = TENSE_KIND.get(tense_name, 'regular')
+                    
+                    if kind == 'imp':
+                        # Imperative: tu=0, nous=1, vous=2
+                        if imp_index is not None and imp_index < len(tense_data):
+                            conjugated_form = tense_data[imp_index]
+                    elif kind == 'impersonal':
+                        # Skip infinitive/participle for person-specific display
+                        continue
+                    else:
+                        # Regular 6-person conjugation
+                        if person_index is not None and person_index < len(tense_data):
+                            conjugated_form = tense_data[person_index]
+                    
+                    if conjugated_form:
+                        full_tense_name = f"{mood_name} {tense_name}"
+                        table.add_row(full_tense_name, conjugated_form)
+                        found_any = True
+    
+    if not found_any:
+        raise ConjError(f"No conjugations found for person '{person}'")
+    
+    console.print(table)
 
 def display_specific_conjugation(verb, person, tense):
     """Display specific conjugation for person and tense"""
-    # Get tense info
-    tense_info = TENSES.get(tense)
-    if not tense_info:
-        console.print(f"[bold red]❌ Unknown tense: '{tense}'[/bold red]")
-        return
+    from rich.panel import Panel
     
-    # Check cache first
-    cached_result = conj_cache.get(verb, 'specific', person, tense)
-    if cached_result:
-        result = cached_result
-    else:
-        try:
-            result = cg.conjugate(verb)
-            
-            # Cache the result
-            if result:
-                conj_cache.set(result, verb, 'specific', person, tense)
-        except Exception as e:
-            console.print(f"[bold red]❌ Error conjugating '{verb}': {e}[/bold red]")
-            return
+    # The requested form is cached on its own, so a hit is one lookup and a panel
+    conjugated_form = conj_cache.get(verb, 'form', person, tense)
     
-    try:
-        
-        if not result or 'moods' not in result:
-            console.print("[bold red]❌ No conjugations found[/bold red]")
-            return
+    if not conjugated_form:
+        # Get tense info
+        tense_info = TENSES.get(tense)
+        if not tense_info:
+            raise ConjError(f"Unknown tense: '{tense}'")
         
-        conjugation = result['moods']
+        conjugation = _fetch(verb)['moods']
         mood = tense_info['mood']
         tense_key = tense_info['tense']
         
         # Find the conjugation
-        conjugated_form = None
-        
         if mood in conjugation and tense_key in conjugation[mood]:
             tense_data = conjugation[mood][tense_key]
             
             if isinstance(tense_data, list) and tense_data:
                 # Handle different types of conjugations
-                if 'infinitif' in tense_key or 'participe' in tense_key:
+                kind = TENSE_KIND.get(tense_key, 'regular')
+                if kind == 'impersonal':
                     # Infinitive and participle forms don't have persons
                     conjugated_form = tense_data[0] if tense_data else None
                     # Update title to not show person for these forms
@@ -383,69 +462,48 @@ def display_specific_conjugation(verb, person, tense):
                     )
                     console.print(result_panel)
                     return
-                elif 'imperatif' in tense_key:
+                elif kind == 'imp':
                     # Imperative: tu=0, nous=1, vous=2
-                    imp_persons = ['tu', 'nous', 'vous']
-                    if person in imp_persons:
-                        imp_index = imp_persons.index(person)
-                        if imp_index < len(tense_data):
-                            conjugated_form = tense_data[imp_index]
+                    imp_index = IMP_INDEX.get(person)
+                    if imp_index is not None and imp_index < len(tense_data):
+                        conjugated_form = tense_data[imp_index]
                 else:
                     # Regular 6-person conjugation
-                    persons = ['je', 'tu', 'il', 'nous', 'vous', 'ils']
-                    person_index = persons.index(person) if person in persons else -1
-                    if person_index != -1 and person_index < len(tense_data):
+                    person_index = PERSON_INDEX.get(person)
+                    if person_index is not None and person_index < len(tense_data):
                         conjugated_form = tense_data[person_index]
         
         if conjugated_form:
-            result_panel = Panel(
-                f"[bold green]{conjugated_form}[/bold green]",
-                title=f"[bold cyan]{person}[/bold cyan] + [bold magenta]{tense}[/bold magenta]",
-                border_style="green"
-            )
-            console.print(result_panel)
-        else:
-            console.print(f"[bold red]❌ No conjugation found for '{person}' in '{tense}'[/bold red]")
+            conj_cache.set(conjugated_form, verb, 'form', person, tense)
     
-    except Exception as e:
-        console.print(f"[bold red]❌ Error: {e}[/bold red]")
+    if not conjugated_form:
+        raise ConjError(f"No conjugation found for '{person}' in '{tense}'")
+    
+    result_panel = Panel(
+        f"[bold green]{conjugated_form}[/bold green]",
+        title=f"[bold cyan]{person}[/bold cyan] + [bold magenta]{tense}[/bold magenta]",
+        border_style="green"
+    )
+    console.print(result_panel)
 
 def display_impersonal_conjugation(verb, tense):
     """Display conjugation for forms that don't use persons (participles, infinitives)"""
-    # Get tense info
-    tense_info = TENSES.get(tense)
-    if not tense_info:
-        console.print(f"[bold red]❌ Unknown tense: '{tense}'[/bold red]")
-        return
+    from rich.panel import Panel
     
-    # Check cache first
-    cached_result = conj_cache.get(verb, 'impersonal', tense)
-    if cached_result:
-        result = cached_result
-    else:
-        try:
-            result = cg.conjugate(verb)
-            
-            # Cache the result
-            if result:
-                conj_cache.set(result, verb, 'impersonal', tense)
-        except Exception as e:
-            console.print(f"[bold red]❌ Error conjugating '{verb}': {e}[/bold red]")
-            return
+    # Cached like specific forms, without a person
+    conjugated_form = conj_cache.get(verb, 'form', tense)
     
-    try:
-        
-        if not result or 'moods' not in result:
-            console.print("[bold red]❌ No conjugations found[/bold red]")
-            return
+    if not conjugated_form:
+        # Get tense info
+        tense_info = TENSES.get(tense)
+        if not tense_info:
+            raise ConjError(f"Unknown tense: '{tense}'")
         
-        conjugation = result['moods']
+        conjugation = _fetch(verb)['moods']
         mood = tense_info['mood']
         tense_key = tense_info['tense']
         
         # Find the conjugation
-        conjugated_form = None
-        
         if mood in conjugation and tense_key in conjugation[mood]:
             tense_data = conjugation[mood][tense_key]
             
@@ -453,20 +511,47 @@ def display_impersonal_conjugation(verb, tense):
                 conjugated_form = tense_data[0] if tense_data else None
         
         if conjugated_form:
-            result_panel = Panel(
-                f"[bold green]{conjugated_form}[/bold green]",
-                title=f"[bold magenta]{verb} - {tense}[/bold magenta]",
-                border_style="green"
-            )
-            console.print(result_panel)
-        else:
-            console.print(f"[bold red]❌ No conjugation found for '{tense}'[/bold red]")
+            conj_cache.set(conjugated_form, verb, 'form', tense)
     
-    except Exception as e:
-        console.print(f"[bold red]❌ Error: {e}[/bold red]")
+    if not conjugated_form:
+        raise ConjError(f"No conjugation found for '{tense}'")
+    
+    result_panel = Panel(
+        f"[bold green]{conjugated_form}[/bold green]",
+        title=f"[bold magenta]{verb} - {tense}[/bold magenta]",
+        border_style="green"
+    )
+    console.print(result_panel)
+
+def display_batch(path, plain=False):
+    """Display all conjugations for every verb listed in a file (one per line, '-' for stdin)"""
+    try:
+        verbs = read_word_list(path)
+    except IOError as e:
+        console.print(f"[bold red]❌ Cannot read verb list: {e}[/bold red]")
+        return
+    
+    # Conjugate every uncached verb in one daemon round trip and cache the results;
+    # verbs that fail are left to the normal path so their errors get reported
+    missing = [verb for verb in verbs if not conj_cache.get(verb, 'all')]
+    if missing:
+        results = conjugation_daemon.conjugate_many(missing)
+        for verb, result in zip(missing, results or []):
+            if result:
+                conj_cache.set(result, verb, 'all')
+    
+    for verb in verbs:
+        if plain:
+            sys.stdout.write(f"\n=== {verb} ===\n")
+        else:
+            console.rule(f"[bold cyan]{verb}[/bold cyan]")
+        with _report():
+            display_all_conjugations(verb, plain)
 
 def show_help():
     """Display help information"""
+    from rich.panel import Panel
+    
     help_text = """
 [bold cyan]French Conjugation Tool[/bold cyan]
 
@@ -483,6 +568,8 @@ def show_help():
 [bold]Special Commands:[/bold]
   cj --help, cj -h             # Show this help
   cj --aliases                 # Show all tense aliases
+  cj --batch <file>            # All conjugations for each verb in a file ('-' for stdin)
+  cj --plain [verb]            # All conjugations as plain lines (also with --batch)
   cj --cache-stats             # Show cache statistics
   cj --clear-cache             # Clear cache
   cj --cleanup-cache           # Remove expired entries
@@ -511,9 +598,35 @@ def show_help():
 """
     console.print(Panel(help_text, border_style="blue"))
 
+# Rendered --aliases output; the table is static, so it is only rebuilt when
+# this script changes
+ALIASES_CACHE = Path.home() / '.cache' / 'french-tools' / 'aliases.ansi'
+
 def show_aliases():
     """Display all tense aliases"""
-    console.print(f"\n🇫🇷 [bold blue]All Tense Aliases[/bold blue]")
+    # Only colour terminals wide enough for the fixed-width table get the cached
+    # copy, since Rich would lay out anything else differently; NO_COLOR always
+    # renders afresh. The copy's first line records the colour system and width
+    # it was rendered for, and it is only replayed on a terminal that matches
+    use_cache = (console.is_terminal and console.width >= 80
+                 and not console.no_color and console.color_system is not None)
+    cache_key = f"{console.color_system} {console.width}"
+    if use_cache:
+        try:
+            if ALIASES_CACHE.stat().st_mtime >= Path(__file__).stat().st_mtime:
+                key, _, rendered = ALIASES_CACHE.read_text(encoding='utf-8').partition('\n')
+                if key == cache_key:
+                    sys.stdout.write(rendered)
+                    return
+        except OSError:
+            pass
+    
+    from rich.table import Table
+    from rich import box
+    
+    out = Console(record=True, color_system=console.color_system) if use_cache else console
+    
+    out.print(f"\n🇫🇷 [bold blue]All Tense Aliases[/bold blue]")
     
     table = Table(box=box.ROUNDED, show_header=True)
     table.add_column("Tense", style="magenta", width=25)
@@ -524,66 +637,152 @@ def show_aliases():
         if aliases:
             table.add_row(tense, aliases)
     
-    console.print(table)
+    out.print(table)
+    
+    out.print(f"\n[dim]💡 Tip: Use any alias in place of the full tense name[/dim]")
+    out.print(f"[dim]Example: 'cj je avoir fut' instead of 'cj je avoir futur simple'[/dim]")
     
-    console.print(f"\n[dim]💡 Tip: Use any alias in place of the full tense name[/dim]")
-    console.print(f"[dim]Example: 'cj je avoir fut' instead of 'cj je avoir futur simple'[/dim]")
+    if use_cache:
+        try:
+            ALIASES_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            ALIASES_CACHE.write_text(cache_key + '\n' + out.export_text(styles=True), encoding='utf-8')
+        except OSError:
+            pass
+
+def clear_cache():
+    """Clear the conjugation cache"""
+    conj_cache.clear()
+    console.print("[green]✅ Conjugation cache cleared[/green]")
+
+def cleanup_cache():
+    """Remove expired entries from the conjugation cache"""
+    removed = conj_cache.cleanup_expired()
+    if removed > 0:
+        console.print(f"[green]✅ Removed {removed} expired entries[/green]")
+    else:
+        console.print("[dim]No expired entries found[/dim]")
+
+# Commands that never conjugate, dispatched before any person/tense parsing
+COMMANDS = {
+    '-h': show_help,
+    '--help': show_help,
+    'help': show_help,
+    '--aliases': show_aliases,
+    '-a': show_aliases,
+    'aliases': show_aliases,
+    '--cache-stats': show_all_cache_stats,
+    '--clear-cache': clear_cache,
+    '--cleanup-cache': cleanup_cache,
+}
 
 def main():
-    if len(sys.argv) < 2:
-        show_help()
-        sys.exit(1)
+    with _report():
+        run()
+
+class _Parser(argparse.ArgumentParser):
+    """ArgumentParser that reports errors through ConjError instead of exiting"""
+    def error(self, message):
+        raise ConjError(message)
+
+class _TenseFlag(argparse.Action):
+    """Record the tense named by a flag such as -pc, and the flag itself for messages"""
+    def __init__(self, option_strings, dest, **kwargs):
+        super().__init__(option_strings, dest, nargs=0, **kwargs)
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        namespace.tense = self.const
+        namespace.tense_flag = option_string
+
+def _build_parser():
+    """Build the command-line parser: command flags plus one flag per tense alias
+    
+    Returns the parser and the set of every flag it accepts.
+    """
+    parser = _Parser(prog='cj', add_help=False, allow_abbrev=False)
+    parser.add_argument('tokens', nargs='*')
+    flags = []
+    
+    def add_flag(name, **kwargs):
+        parser.add_argument(name, **kwargs)
+        flags.append(name)
+    
+    add_flag('--batch', metavar='FILE')
+    # --plain swaps Rich tables for prebuilt plain lines in the all-conjugations view
+    add_flag('--plain', action='store_true')
+    for name, command in COMMANDS.items():
+        if name.startswith('-'):
+            add_flag(name, dest='command', action='store_const', const=command)
+    
+    # Every alias that fits in one argument doubles as a flag: -p, -pc, -futur...
+    for alias, standard in ALIAS_TO_TENSE.items():
+        if ' ' not in alias:
+            add_flag('-' + alias, dest='tense', action=_TenseFlag, const=standard)
+    
+    parser.set_defaults(command=None, tense=None, tense_flag=None)
+    return parser, frozenset(flags)
+
+PARSER, OPTION_STRINGS = _build_parser()
+
+def run():
+    """Parse the command line and dispatch to the matching display"""
+    # Flags are matched case- and accent-insensitively, like the aliases they come from.
+    # Only the name is folded: the value of --batch=PATH is a path and stays as given
+    args = []
+    for arg in sys.argv[1:]:
+        if arg.startswith('-'):
+            name, sep, value = arg.partition('=')
+            arg = fold(name) + sep + value
+        args.append(arg)
+    
+    # Report unknown flags ourselves; argparse would guess at them (-pz as -p -z)
+    for arg in args:
+        if len(arg) > 1 and arg.startswith('-') and arg.split('=', 1)[0] not in OPTION_STRINGS:
+            console.print(f"[bold red]❌ Unknown tense flag: '{arg}'[/bold red]")
+            console.print("Use 'cj --aliases' to see available tense aliases")
+            return
+    
+    ns = PARSER.parse_intermixed_args(args)
     
-    args = sys.argv[1:]
+    if ns.command is None and ns.tokens:
+        ns.command = COMMANDS.get(ns.tokens[0])
     
-    if args[0] in ['-h', '--help', 'help']:
+    if ns.command is None and ns.batch is None and ns.tense is None and not ns.tokens:
         show_help()
-        return
+        sys.exit(1)
     
-    if args[0] in ['--aliases', '-a', 'aliases']:
-        show_aliases()
+    dispatch(ns)
+
+def dispatch(ns):
+    """Call the display function selected by the parsed command line"""
+    if ns.command:
+        ns.command()
         return
     
-    # Handle cache management commands
-    if args[0] == '--cache-stats':
-        show_all_cache_stats()
-        return
-    elif args[0] == '--clear-cache':
-        conj_cache.clear()
-        console.print("[green]✅ Conjugation cache cleared[/green]")
-        return
-    elif args[0] == '--cleanup-cache':
-        removed = conj_cache.cleanup_expired()
-        if removed > 0:
-            console.print(f"[green]✅ Removed {removed} expired entries[/green]")
-        else:
-            console.print("[dim]No expired entries found[/dim]")
+    if ns.batch is not None:
+        if ns.tokens:
+            raise ConjError("Use: cj --batch <file>")
+        display_batch(ns.batch, ns.plain)
         return
     
-    # Check for flag format: cj -<tense> <person> <verb>
-    if args[0].startswith('-') and len(args[0]) > 1:
-        # Flag format detected
-        tense_flag = args[0][1:]  # Remove the '-' prefix
-        tense = normalize_tense(tense_flag)
-        
-        if not tense:
-            console.print(f"[bold red]❌ Unknown tense flag: '-{tense_flag}'[/bold red]")
-            console.print("Use 'cj --aliases' to see available tense aliases")
-            return
+    args = ns.tokens
+    plain = ns.plain
+    
+    # Flag format: cj -<tense> <person> <verb>
+    if ns.tense:
+        tense, tense_flag = ns.tense, ns.tense_flag
         
-        if len(args) == 2:
+        if len(args) == 1:
             # cj -<tense> <verb> (for participles/infinitives)
-            verb = args[1]
-            tense_info = TENSES.get(tense)
-            if tense_info and ('participe' in tense_info['mood'] or 'infinitif' in tense_info['mood']):
+            verb = args[0]
+            if tense in IMPERSONAL_TENSES:
                 display_impersonal_conjugation(verb, tense)
             else:
-                console.print(f"[bold red]❌ Tense '{tense}' requires a person. Use: cj -{tense_flag} <person> <verb>[/bold red]")
+                console.print(f"[bold red]❌ Tense '{tense}' requires a person. Use: cj {tense_flag} <person> <verb>[/bold red]")
             return
         
-        elif len(args) == 3:
+        elif len(args) == 2:
             # cj -<tense> <person> <verb>
-            person_input, verb = args[1], args[2]
+            person_input, verb = args
             person = normalize_person(person_input)
             
             if not person:
@@ -592,74 +791,57 @@ def main():
                 return
             
             # Check if this tense doesn't need a person
-            tense_info = TENSES.get(tense)
-            if tense_info and ('participe' in tense_info['mood'] or 'infinitif' in tense_info['mood']):
+            if tense in IMPERSONAL_TENSES:
                 display_impersonal_conjugation(verb, tense)
             else:
                 display_specific_conjugation(verb, person, tense)
             return
         
         else:
-            console.print(f"[bold red]❌ Invalid flag format. Use: cj -{tense_flag} <person> <verb> or cj -{tense_flag} <verb> (for participles)[/bold red]")
+            console.print(f"[bold red]❌ Invalid flag format. Use: cj {tense_flag} <person> <verb> or cj {tense_flag} <verb> (for participles)[/bold red]")
             return
     
-    # Original format parsing
+    # Original format: classify every token once, then dispatch on the kinds.
+    # Positions still decide the role of a token, so a verb that happens to be
+    # spelled like an alias (cj je p) is conjugated rather than rejected.
+    tokens = [_classify(arg) for arg in args]
+    kinds = tuple(kind for kind, _ in tokens)
+    
     if len(args) == 1:
         # Mode 1: All conjugations
-        verb = args[0]
-        display_all_conjugations(verb)
+        display_all_conjugations(args[0], plain)
     
     elif len(args) == 2:
         # Mode 2: Person + verb OR verb + tense (for participles/infinitives)
-        person_input, verb = args
-        person = normalize_person(person_input)
-        tense = normalize_tense(verb)  # Check if second arg is a tense
-        
-        if not person and tense:
-            # This is probably: verb + tense (participle/infinitive)
-            tense_info = TENSES.get(tense)
-            if tense_info and ('participe' in tense_info['mood'] or 'infinitif' in tense_info['mood']):
-                verb_name = person_input  # First arg is actually the verb
-                display_impersonal_conjugation(verb_name, tense)
+        if kinds[0] != 'P':
+            if kinds[1] == 'T' and tokens[1][1] in IMPERSONAL_TENSES:
+                display_impersonal_conjugation(args[0], tokens[1][1])
                 return
-        
-        if not person:
-            console.print(f"[bold red]❌ Unknown person: '{person_input}'[/bold red]")
+            console.print(f"[bold red]❌ Unknown person: '{args[0]}'[/bold red]")
             console.print("Valid persons: je, tu, il/elle/on, nous, vous, ils/elles")
             return
         
-        display_person_conjugations(verb, person)
+        display_person_conjugations(args[1], tokens[0][1])
     
     elif len(args) == 3:
         # Mode 3: Person + verb + tense OR verb + tense (for participles/infinitives)
-        person_input, verb, tense_input = args
-        person = normalize_person(person_input)
-        tense = normalize_tense(tense_input)
-        
-        # Check if first argument might be a verb instead of person (for participles/infinitives)
-        if not person and tense:
-            tense_info = TENSES.get(tense)
-            if tense_info and ('participe' in tense_info['mood'] or 'infinitif' in tense_info['mood']):
-                # This is probably: verb + tense (participle/infinitive)
-                verb = person_input  # First arg is actually the verb
-                display_impersonal_conjugation(verb, tense)
+        if kinds[0] != 'P':
+            if kinds[2] == 'T' and tokens[2][1] in IMPERSONAL_TENSES:
+                display_impersonal_conjugation(args[0], tokens[2][1])
                 return
-        
-        if not person:
-            console.print(f"[bold red]❌ Unknown person: '{person_input}'[/bold red]")
+            console.print(f"[bold red]❌ Unknown person: '{args[0]}'[/bold red]")
             return
         
-        if not tense:
-            console.print(f"[bold red]❌ Unknown tense: '{tense_input}'[/bold red]")
+        if kinds[2] != 'T':
+            console.print(f"[bold red]❌ Unknown tense: '{args[2]}'[/bold red]")
             console.print("Use 'cj --help' to see available tenses")
             return
         
-        # Check if this tense doesn't need a person
-        tense_info = TENSES.get(tense)
-        if tense_info and ('participe' in tense_info['mood'] or 'infinitif' in tense_info['mood']):
-            display_impersonal_conjugation(verb, tense)
+        tense = tokens[2][1]
+        if tense in IMPERSONAL_TENSES:
+            display_impersonal_conjugation(args[1], tense)
         else:
-            display_specific_conjugation(verb, person, tense)
+            display_specific_conjugation(args[1], tokens[0][1], tense)
     
     else:
         console.print("[bold red]❌ Too many arguments[/bold red]")
@@ -5,169 +5,185 @@ Beautiful terminal output with comprehensive French definitions
 """
 
 import sys
-import requests
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from lxml import etree
 import re
 from rich.console import Console
-from rich.table import Table
-from rich import box
-from rich.text import Text
-from rich.panel import Panel
 from tool_cache import ToolCache, show_all_cache_stats, clear_all_caches, cleanup_expired_all
+from tool_io import REQUEST_TIMEOUT, get_session, utf8_body, parse_html, prefetch, read_word_list
+
+try:
+    import re2  # Optional: linear-time engine for the page-wide scans
+except ImportError:
+    re2 = None
 
 console = Console()
 
+# Patterns used on every lookup, compiled once
+LIST_NOISE_RE = re.compile(r'Newsletter|Toggle|LAROUSSE|DICTIONNAIRE|EN ES DE IT', re.IGNORECASE)
+PARAGRAPH_NOISE_RE = re.compile(r'Newsletter|Toggle|LAROUSSE|DICTIONNAIRE', re.IGNORECASE)
+ETYMOLOGY_NOISE_RE = re.compile(r'Newsletter|Toggle|LAROUSSE', re.IGNORECASE)
+NUMBERED_RE = re.compile(r'^(\d+\.)\s*(.*)')
+# A definition's leading number and any field indicator glued to a sense
+# number further on (e.g. "Physique4. Text"), both found in one match
+DEF_FORMAT_RE = re.compile(
+    r'^(?:(?P<number>\d+\.)\s*)?'
+    r'(?:(?P<before>.*?)'
+    r'(?P<field>Botanique|Héraldique|Liturgie|Littéraire|Familier|Populaire|Physique|Topographie|Mathématiques|Médecine|Droit|Histoire|Géographie|Économie|Informatique)'
+    r'(?P<field_number>\d+)\.\s*)?'
+    r'(?P<rest>.*)'
+)
+# Larousse's not-found page; matched on the raw body, so accents and entities don't matter
+NOT_FOUND_MARKER = 'Page non trouv'
+NOT_FOUND_MARKER_BYTES = NOT_FOUND_MARKER.encode('ascii')
+
 # Initialize Larousse cache
 lr_cache = ToolCache('larousse', max_age_days=14)  # Cache for 14 days
+# Tag of the extracted entry cached next to each page; bump it when the extract_* functions change
+PARSED_KEY = 'parsed_v2'
+# Stored in place of an extracted entry for words Larousse has no page for,
+# so repeated typos are answered from the cache instead of the network
+NOT_FOUND_ENTRY = 'not_found'
+
+# Pages are read in chunks and the download stops after the main content
+DOWNLOAD_CHUNK_SIZE = 16 * 1024
+MAIN_END = b'</main>'
+
+# Compiled XPath queries over the parsed page; each runs as one traversal in
+# libxml2. Class tests are plain substring checks, so they stay in C too
+def _class_contains(*words):
+    """XPath predicate: the class attribute contains any of the given words"""
+    return ' or '.join(f"contains(@class, '{word}')" for word in words)
+
+# Page chrome marked only by class; nav/header/footer tags are stripped by name
+CHROME_CLASS_XPATH = etree.XPath(
+    f"//*[{_class_contains('nav', 'menu', 'header', 'footer', 'sidebar')}]")
+MAIN_CONTENT_XPATHS = [
+    etree.XPath("(//main)[1]"),
+    etree.XPath("(//article)[1]"),
+    etree.XPath(f"(//div[{_class_contains('content', 'entry', 'definition')}])[1]"),
+]
+LISTS_XPATH = etree.XPath(".//ol | .//ul")
+LIST_ITEMS_XPATH = etree.XPath(".//li")
+SYNONYMS_XPATH = etree.XPath(
+    f".//span[{_class_contains('syn')}] | .//em[{_class_contains('syn')}]")
+PARAGRAPHS_XPATH = etree.XPath(".//p | .//div")
+# Items inside expression sections, in document order; an item inside nested
+# sections is returned once
+# Items whose text is 5 characters or less even before clean_text are rejected in
+# libxml2; clean_text only ever shortens the text, so nothing it would keep is lost
+EXPRESSION_ITEMS_XPATH = etree.XPath(
+    f"//*[self::div or self::section][{_class_contains('express', 'example', 'phrase')}]"
+    "//*[self::li or self::div or self::span][string-length(normalize-space()) > 5]")
+
+def compile_page_scan(pattern):
+    """Compile a pattern that runs over the whole page text, with RE2 when installed"""
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
 
 def clean_text(text):
     """Clean and format text from HTML"""
     if not text:
         return ""
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = ' '.join(text.split())
     # Remove unwanted symbols
     text = text.replace('⇒', '').replace('▷', '')
     return text
 
+# Marker lists hold the capitalized form; the lowercase form is matched too
+# Style and register markers
+STYLE_MARKERS = [
+    'Littéraire', 'Familier', 'Populaire', 'Soutenu', 'Vieilli',
+    'Argotique', 'Péjoratif', 'Ironique', 'Plaisant', 'Vulgaire'
+]
+
+# Semantic relationship indicators
+SEMANTIC_MARKERS = [
+    'Synonymes', 'Synonyme', 'Contraires', 'Contraire', 'Antonymes', 'Antonyme'
+]
+
+# Domain and field markers (comprehensive list)
+DOMAIN_MARKERS = [
+    'Botanique', 'Zoologie', 'Médecine', 'Anatomie', 'Physiologie', 'Psychologie',
+    'Philosophie', 'Religion', 'Théologie', 'Liturgie', 'Histoire', 'Géographie',
+    'Politique', 'Économie', 'Droit', 'Juridique', 'Militaire', 'Marine',
+    'Aviation', 'Automobile', 'Technique', 'Technologie', 'Informatique', 'Physique',
+    'Chimie', 'Mathématiques', 'Géométrie', 'Astronomie', 'Astrologie', 'Météorologie',
+    'Géologie', 'Minéralogie', 'Agriculture', 'Horticulture', 'Cuisine', 'Gastronomie',
+    'Mode', 'Couture', 'Arts', 'Peinture', 'Sculpture', 'Musique',
+    'Danse', 'Théâtre', 'Cinéma', 'Littérature', 'Poésie', 'Architecture',
+    'Héraldique', 'Topographie', 'Cartographie', 'Sports', 'Jeux', 'Échecs',
+    'Cartes', 'Photographie', 'Typographie', 'Linguistique', 'Grammaire', 'Rhétorique'
+]
+
+def _marker_alternation(markers):
+    """Regex alternation of the markers in both capitalized and lowercase form"""
+    variants = [form for marker in markers for form in (marker, marker[0].lower() + marker[1:])]
+    return '|'.join(map(re.escape, variants))
+
+# All three marker categories in one pattern, so highlighting is a single scan;
+# the categories share no words, so this matches what three passes would
+MARKER_RE = re.compile(
+    r'\b(?:(?P<style>' + _marker_alternation(STYLE_MARKERS) + r')\b'
+    r'|(?P<semantic>' + _marker_alternation(SEMANTIC_MARKERS) + r')\s*:'
+    r'|(?P<domain>' + _marker_alternation(DOMAIN_MARKERS) + r')\.)'
+)
+# Domain markers the field indicator logic has already formatted
+FORMATTED_DOMAIN_RE = re.compile(r'\[bold magenta\]([^\[.]+)\.\[/bold magenta\]')
+
 def highlight_larousse_indicators(text):
     """Highlight common Larousse dictionary indicators and markers"""
-    # Style and register markers
-    style_markers = [
-        'Littéraire', 'littéraire',
-        'Familier', 'familier', 
-        'Populaire', 'populaire',
-        'Soutenu', 'soutenu',
-        'Vieilli', 'vieilli',
-        'Argotique', 'argotique',
-        'Péjoratif', 'péjoratif',
-        'Ironique', 'ironique',
-        'Plaisant', 'plaisant',
-        'Vulgaire', 'vulgaire'
-    ]
-    
-    # Semantic relationship indicators
-    semantic_markers = [
-        'Synonymes', 'synonymes', 'Synonyme', 'synonyme',
-        'Contraires', 'contraires', 'Contraire', 'contraire',
-        'Antonymes', 'antonymes', 'Antonyme', 'antonyme'
-    ]
+    # Domain markers already handled by field indicator logic are left alone
+    formatted = set(FORMATTED_DOMAIN_RE.findall(text))
     
-    # Domain and field markers (comprehensive list)
-    domain_markers = [
-        'Botanique', 'botanique',
-        'Zoologie', 'zoologie', 
-        'Médecine', 'médecine',
-        'Anatomie', 'anatomie',
-        'Physiologie', 'physiologie',
-        'Psychologie', 'psychologie',
-        'Philosophie', 'philosophie',
-        'Religion', 'religion',
-        'Théologie', 'théologie',
-        'Liturgie', 'liturgie',
-        'Histoire', 'histoire',
-        'Géographie', 'géographie',
-        'Politique', 'politique',
-        'Économie', 'économie',
-        'Droit', 'droit',
-        'Juridique', 'juridique',
-        'Militaire', 'militaire',
-        'Marine', 'marine',
-        'Aviation', 'aviation',
-        'Automobile', 'automobile',
-        'Technique', 'technique',
-        'Technologie', 'technologie',
-        'Informatique', 'informatique',
-        'Physique', 'physique',
-        'Chimie', 'chimie',
-        'Mathématiques', 'mathématiques',
-        'Géométrie', 'géométrie',
-        'Astronomie', 'astronomie',
-        'Astrologie', 'astrologie',
-        'Météorologie', 'météorologie',
-        'Géologie', 'géologie',
-        'Minéralogie', 'minéralogie',
-        'Agriculture', 'agriculture',
-        'Horticulture', 'horticulture',
-        'Cuisine', 'cuisine',
-        'Gastronomie', 'gastronomie',
-        'Mode', 'mode',
-        'Couture', 'couture',
-        'Arts', 'arts',
-        'Peinture', 'peinture',
-        'Sculpture', 'sculpture',
-        'Musique', 'musique',
-        'Danse', 'danse',
-        'Théâtre', 'théâtre',
-        'Cinéma', 'cinéma',
-        'Littérature', 'littérature',
-        'Poésie', 'poésie',
-        'Architecture', 'architecture',
-        'Héraldique', 'héraldique',
-        'Topographie', 'topographie',
-        'Cartographie', 'cartographie',
-        'Sports', 'sports',
-        'Jeux', 'jeux',
-        'Échecs', 'échecs',
-        'Cartes', 'cartes',
-        'Photographie', 'photographie',
-        'Typographie', 'typographie',
-        'Linguistique', 'linguistique',
-        'Grammaire', 'grammaire',
-        'Rhétorique', 'rhétorique'
-    ]
+    def highlight(match):
+        kind = match.lastgroup
+        marker = match.group(kind)
+        if kind == 'style':
+            # Style markers in italic yellow
+            return f'[italic yellow]{marker}[/italic yellow]'
+        if kind == 'semantic':
+            # Semantic markers in bold cyan
+            return f'[bold cyan]{marker}[/bold cyan]:'
+        # Highlight standalone domain markers, unless already formatted
+        if marker in formatted:
+            return match.group(0)
+        return f'[bold magenta]{marker}.[/bold magenta]'
     
-    # Apply highlighting
-    # Style markers in italic yellow
-    for marker in style_markers:
-        pattern = r'\b(' + re.escape(marker) + r')\b'
-        text = re.sub(pattern, r'[italic yellow]\1[/italic yellow]', text)
-    
-    # Semantic markers in bold cyan  
-    for marker in semantic_markers:
-        pattern = r'\b(' + re.escape(marker) + r')\s*:'
-        text = re.sub(pattern, r'[bold cyan]\1[/bold cyan]:', text)
-    
-    # Domain markers already handled by field indicator logic, but highlight standalone ones
-    for marker in domain_markers:
-        # Only highlight if not already processed by field indicator logic
-        if f'[bold magenta]{marker}.[/bold magenta]' not in text:
-            pattern = r'\b(' + re.escape(marker) + r')\.'
-            text = re.sub(pattern, r'[bold magenta]\1.[/bold magenta]', text)
-    
-    return text
+    return MARKER_RE.sub(highlight, text)
 
-def extract_definitions(soup):
+def extract_definitions(tree):
     """Extract numbered definitions from the page"""
     definitions = []
     
-    # Remove navigation and header elements to focus on content
-    for nav in soup.find_all(['nav', 'header', 'footer']):
-        nav.decompose()
-    for elem in soup.find_all(class_=re.compile(r'nav|menu|header|footer|sidebar')):
-        elem.decompose()
-    
     # Look for the main content area first
-    main_content = soup.find('main') or soup.find('article') or soup.find('div', class_=re.compile(r'content|entry|definition'))
-    if main_content:
-        soup = main_content
+    for xpath in MAIN_CONTENT_XPATHS:
+        main_content = xpath(tree)
+        if main_content:
+            tree = main_content[0]
+            break
     
     # Find ordered/unordered lists that contain numbered definitions
-    def_lists = soup.find_all(['ol', 'ul'])
+    def_lists = LISTS_XPATH(tree)
     
     for def_list in def_lists:
-        items = def_list.find_all('li')
+        items = LIST_ITEMS_XPATH(def_list)
         for item in items:
-            text = clean_text(item.get_text())
+            text = clean_text(item.text_content())
             # Filter out navigation items and short content
             if (text and len(text) > 20 and 
-                not re.search(r'Newsletter|Toggle|LAROUSSE|DICTIONNAIRE|EN ES DE IT', text, re.IGNORECASE)):
+                not LIST_NOISE_RE.search(text)):
                 
                 # Look for synonyms in the same item
                 synonyms = []
-                syn_elements = item.find_all(['span', 'em'], class_=re.compile(r'syn|synonym'))
+                syn_elements = SYNONYMS_XPATH(item)
                 for syn in syn_elements:
-                    syn_text = clean_text(syn.get_text())
+                    syn_text = clean_text(syn.text_content())
                     if syn_text and syn_text not in synonyms:
                         synonyms.append(syn_text)
                 
@@ -178,12 +194,12 @@ def extract_definitions(soup):
     
     # If no lists found, look for numbered paragraphs
     if not definitions:
-        all_paragraphs = soup.find_all(['p', 'div'])
+        all_paragraphs = PARAGRAPHS_XPATH(tree)
         for para in all_paragraphs:
-            text = clean_text(para.get_text())
+            text = clean_text(para.text_content())
             if (text and len(text) > 20 and
-                re.match(r'^\d+\.', text.strip()) and  # Starts with number
-                not re.search(r'Newsletter|Toggle|LAROUSSE|DICTIONNAIRE', text, re.IGNORECASE)):
+                NUMBERED_RE.match(text.strip()) and  # Starts with number
+                not PARAGRAPH_NOISE_RE.search(text)):
                 definitions.append({
                     'text': text,
                     'synonyms': []
@@ -191,132 +207,210 @@ def extract_definitions(soup):
     
     return definitions[:8]  # Limit to 8 main definitions
 
-def extract_etymology(soup):
+# Etymology patterns in order of preference, each capturing the etymology text.
+# They are searched one after another: a single alternation would miss matches
+# that overlap an earlier, less preferred one
+ETYMOLOGY_RES = [compile_page_scan('(?i)' + pattern) for pattern in [
+    r'\(([^)]*latin[^)]*)\)',       # (latin ...)
+    r'\(([^)]*grec[^)]*)\)',        # (grec ...)
+    r'\(([^)]*du [^)]*)\)',         # (du ...)
+    r'\(([^)]*de [^)]*)\)',         # (de ...)
+    r'étymologie[:\s\xa0]+([^.]+)',  # étymologie: ... (RE2's \s is ASCII-only)
+]]
+
+def extract_etymology(page_text):
     """Extract etymology information"""
-    # Search for etymology patterns in parentheses (common Larousse format)
-    all_text = soup.get_text()
-    
-    # Look for etymology in parentheses, typically after grammatical info
-    etym_patterns = [
-        r'\(([^)]*latin[^)]*)\)',  # (latin ...)
-        r'\(([^)]*grec[^)]*)\)',   # (grec ...)
-        r'\(([^)]*du [^)]*)\)',    # (du ...)
-        r'\(([^)]*de [^)]*)\)',    # (de ...)
-        r'étymologie[:\s]+([^.]+)', # étymologie: ...
-    ]
-    
-    for pattern in etym_patterns:
-        match = re.search(pattern, all_text, re.IGNORECASE)
+    for pattern in ETYMOLOGY_RES:
+        match = pattern.search(page_text)
         if match:
-            etym_text = clean_text(match.group(1) if match.lastindex else match.group())
+            etym_text = clean_text(match.group(1))
             # Filter out non-etymology content
-            if etym_text and not re.search(r'Newsletter|Toggle|LAROUSSE', etym_text, re.IGNORECASE):
+            if etym_text and not ETYMOLOGY_NOISE_RE.search(etym_text):
                 return etym_text
     
     return None
 
-def extract_expressions(soup):
+def extract_expressions(tree):
     """Extract expressions and examples"""
     expressions = []
     
-    # Look for expression sections
-    expr_containers = soup.find_all(['div', 'section'], class_=re.compile(r'express|example|phrase'))
+    # Items across all expression sections come from a single query
+    for item in EXPRESSION_ITEMS_XPATH(tree):
+        text = clean_text(item.text_content())
+        if text and len(text) > 5 and len(text) < 200:  # Reasonable length expressions
+            expressions.append(text)
+            if len(expressions) == 6:  # Limit to 6 expressions
+                break
     
-    for container in expr_containers:
-        items = container.find_all(['li', 'div', 'span'])
-        for item in items:
-            text = clean_text(item.get_text())
-            if text and len(text) > 5 and len(text) < 200:  # Reasonable length expressions
-                expressions.append(text)
-    
-    return expressions[:6]  # Limit to 6 expressions
+    return expressions
+
+# French grammatical terms (Larousse format) in order of preference, with the
+# label shown for each (None shows the matched term itself)
+GRAM_PATTERNS = [
+    (r'nom féminin', 'n.f.'),    # noun feminine
+    (r'nom masculin', 'n.m.'),   # noun masculine
+    (r'adjectif', 'adj.'),       # adjective
+    (r'verbe', 'v.'),            # verb
+    (r'adverbe', 'adv.'),        # adverb
+    (r'préposition', None),      # preposition
+    (r'conjonction', None),      # conjunction
+    (r'interjection', None),     # interjection
+    (r'pronom', None),           # pronoun
+    (r'n\.f\.', 'n.f.'),         # abbrev noun feminine
+    (r'n\.m\.', 'n.m.'),         # abbrev noun masculine
+    (r'adj\.', 'adj.'),          # abbrev adjective
+    (r'v\.', 'v.'),              # abbrev verb
+    (r'adv\.', 'adv.'),          # abbrev adverb
+]
+# Searched one by one, in order: "pronom masculin" must still find "nom masculin"
+GRAM_RES = [(compile_page_scan('(?i)' + pattern), label) for pattern, label in GRAM_PATTERNS]
 
-def extract_grammatical_info(soup):
+def extract_grammatical_info(page_text):
     """Extract grammatical information (nom féminin, adj., etc.)"""
-    # Look for French grammatical terms (Larousse format)
-    page_text = soup.get_text()
-    
-    gram_patterns = [
-        r'nom féminin',    # noun feminine
-        r'nom masculin',   # noun masculine
-        r'adjectif',       # adjective  
-        r'verbe',          # verb
-        r'adverbe',        # adverb
-        r'préposition',    # preposition
-        r'conjonction',    # conjunction
-        r'interjection',   # interjection
-        r'pronom',         # pronoun
-        r'n\.f\.',         # abbrev noun feminine
-        r'n\.m\.',         # abbrev noun masculine
-        r'adj\.',          # abbrev adjective
-        r'v\.',            # abbrev verb
-        r'adv\.',          # abbrev adverb
-    ]
-    
-    for pattern in gram_patterns:
-        match = re.search(pattern, page_text, re.IGNORECASE)
+    for pattern, label in GRAM_RES:
+        match = pattern.search(page_text)
         if match:
-            # Clean up the match
-            gram_info = match.group().lower()
-            # Return standardized format
-            if 'féminin' in gram_info or 'n.f.' in gram_info:
-                return 'n.f.'
-            elif 'masculin' in gram_info or 'n.m.' in gram_info:
-                return 'n.m.'
-            elif 'adjectif' in gram_info or 'adj.' in gram_info:
-                return 'adj.'
-            elif 'verbe' in gram_info or 'v.' in gram_info:
-                return 'v.'
-            elif 'adverbe' in gram_info or 'adv.' in gram_info:
-                return 'adv.'
-            else:
-                return gram_info
+            return label or match.group().lower()
     
     return None
 
-def get_definition(word):
-    """Get French definition from Larousse with beautiful Rich formatting"""
-    url = f"https://www.larousse.fr/dictionnaires/francais/{word.lower()}"
+class LarousseError(Exception):
+    """A lookup that cannot be displayed; the message is shown as-is"""
+
+class WordNotFoundError(LarousseError):
+    """Larousse has no entry for the word"""
+
+def not_found(word):
+    """The error for a word Larousse has no entry for"""
+    return WordNotFoundError(f"Mot '{word}' non trouvé dans le dictionnaire Larousse")
+
+def parse_page(content):
+    """Parse a Larousse page into an lxml tree, minus scripts, styles and page chrome"""
+    tree = parse_html(content)
+    # Their text is never entry content and would leak into text_content();
+    # navigation, header and footer tags go in the same C-level pass
+    etree.strip_elements(tree, 'script', 'style', 'template', 'nav', 'header', 'footer', with_tail=False)
+    # Chrome that is only marked by its class is dropped here too, keeping tail text
+    for elem in CHROME_CLASS_XPATH(tree):
+        elem.drop_tree()
+    return tree
+
+def page_url(word):
+    """URL of the Larousse page for a word"""
+    return f"https://www.larousse.fr/dictionnaires/francais/{word.lower()}"
+
+def download_page(word):
+    """Download the raw Larousse page for a word, stopping once the main content is in
     
+    Everything the extractors use sits inside <main>; what follows it is footer
+    and scripts, so the rest is never read off the network. The connection is
+    closed with the tail unread, so it is not reused for the next request: the
+    footer costs more to download than a new handshake.
+    """
+    with get_session().get(page_url(word), timeout=REQUEST_TIMEOUT, stream=True) as response:
+        if response.status_code == 404:
+            raise not_found(word)
+        response.raise_for_status()
+        
+        body = bytearray()
+        main_end = -1
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            # Search from just before the new chunk, in case the tag spans two chunks
+            start = max(0, len(body) - len(MAIN_END) + 1)
+            body += chunk
+            main_end = body.find(MAIN_END, start)
+            if main_end != -1:
+                break
+        
+        # A not-found page is recognised on everything received, before the
+        # part after </main> is cut off and the rest of the page is cached
+        if NOT_FOUND_MARKER_BYTES in body:
+            raise not_found(word)
+        if main_end != -1:
+            del body[main_end + len(MAIN_END):]
+        return utf8_body(response, bytes(body))
+
+def fetch_page(word):
+    """Fetch the Larousse page for a word (from cache if possible) and parse it"""
     # Check cache first
-    cached_result = lr_cache.get(word.lower())
-    if cached_result:
-        soup = BeautifulSoup(cached_result, 'html.parser')
-    else:
+    content = lr_cache.get(word.lower())
+    if not content:
+        import requests
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            # Cache the HTML content
-            lr_cache.set(response.text, word.lower())
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Cache the raw bytes and parse the same buffer, without decoding to str
+            content = download_page(word)
+            lr_cache.set(content, word.lower())
         except requests.RequestException as e:
-            console.print(f"[bold red]❌ Erreur d'accès à Larousse: {e}[/bold red]")
-            return
-        except Exception as e:
-            console.print(f"[bold red]❌ Erreur d'analyse: {e}[/bold red]")
-            return
+            raise LarousseError(f"Erreur d'accès à Larousse: {e}") from e
+    
+    # A not-found page is recognised from the raw body, so it is never parsed
+    marker = NOT_FOUND_MARKER if isinstance(content, str) else NOT_FOUND_MARKER_BYTES
+    if marker in content:
+        raise not_found(word)
+    
+    try:
+        return parse_page(content)
+    except Exception as e:
+        raise LarousseError(f"Erreur d'analyse: {e}") from e
+
+@lru_cache(maxsize=128)
+def lookup(word):
+    """Fetch and extract a Larousse entry, memoized for the lifetime of the process
+    
+    Returns (definitions, etymology, expressions, grammatical_info).
+    """
+    # The extracted entry is cached next to the page, so a hit skips parsing
+    cached_entry = lr_cache.get(word.lower(), PARSED_KEY)
+    if cached_entry == NOT_FOUND_ENTRY:
+        raise not_found(word)
+    if cached_entry:
+        return cached_entry
+    
+    try:
+        tree = fetch_page(word)
+    except WordNotFoundError:
+        # Only a 404 status or the not-found page is certain enough to remember
+        lr_cache.set(NOT_FOUND_ENTRY, word.lower(), PARSED_KEY)
+        raise
+    
+    # The page text is computed once for every text-based check below
+    definitions = extract_definitions(tree)
+    page_text = tree.text_content()
+    
+    # "Page non trouvée" was already caught on the raw body; a 404 can still show in the text.
+    # Real entries can contain "404" too (a year, a number), so this is not cached
+    if "404" in page_text:
+        raise not_found(word)
+    
+    # Extract information
+    etymology = extract_etymology(page_text)
+    expressions = extract_expressions(tree)
+    grammatical_info = extract_grammatical_info(page_text)
     
-    # Check if the word was found
-    if "Page non trouvée" in soup.get_text() or "404" in soup.get_text():
-        console.print(f"[bold red]❌ Mot '{word}' non trouvé dans le dictionnaire Larousse[/bold red]")
+    entry = (tuple(definitions), etymology, tuple(expressions), grammatical_info)
+    lr_cache.set(entry, word.lower(), PARSED_KEY)
+    return entry
+
+def get_definition(word):
+    """Get French definition from Larousse with beautiful Rich formatting"""
+    try:
+        definitions, etymology, expressions, grammatical_info = lookup(word)
+    except LarousseError as e:
+        console.print(f"[bold red]❌ {e}[/bold red]")
+        return
+    except Exception as e:
+        console.print(f"[bold red]❌ Erreur lors de l'analyse de la page: {e}[/bold red]")
         return
     
     try:
-        # Extract information
-        definitions = extract_definitions(soup)
-        etymology = extract_etymology(soup)
-        expressions = extract_expressions(soup)
-        grammatical_info = extract_grammatical_info(soup)
-        
         if not definitions:
             console.print(f"[bold red]❌ Aucune définition trouvée pour '{word}'[/bold red]")
             return
         
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich import box
+        
         # Create header panel
         title = f"🇫🇷 Larousse: [bold cyan]{word}[/bold cyan]"
         if grammatical_info:
@@ -335,28 +429,20 @@ def get_definition(word):
         for definition in definitions:
             def_text = definition['text'].strip()  # Remove leading/trailing whitespace
             
-            # Clean up definition text and improve formatting
-            # Handle field indicators that appear mid-text (e.g., "Physique4. Text")
-            # First, try to separate field names that are attached to numbers
-            field_pattern = r'(Botanique|Héraldique|Liturgie|Littéraire|Familier|Populaire|Physique|Topographie|Mathématiques|Médecine|Droit|Histoire|Géographie|Économie|Informatique)(\d+)\.\s*(.*)'
-            field_match = re.search(field_pattern, def_text)
+            # Clean up definition text and improve formatting in one match
+            match = DEF_FORMAT_RE.match(def_text)
+            number, before, field, field_number, rest = match.group(
+                'number', 'before', 'field', 'field_number', 'rest')
             
-            if field_match:
-                field, number, rest = field_match.groups()
-                # Replace the field+number pattern with proper formatting
-                before_field = def_text[:field_match.start()].strip()
-                if before_field:
-                    def_text = f"{before_field} [bold green]{number}.[/bold green] [bold magenta]{field}.[/bold magenta] {rest.strip()}"
-                else:
-                    def_text = f"[bold green]{number}.[/bold green] [bold magenta]{field}.[/bold magenta] {rest.strip()}"
+            if field:
+                # Handle field indicators that appear mid-text (e.g., "Physique4. Text")
+                rest = f"[bold green]{field_number}.[/bold green] [bold magenta]{field}.[/bold magenta] {rest.strip()}"
+                before = before.strip()
+                if before:
+                    rest = f"{before} {rest}"
             
             # Ensure numbered definitions are clearly visible
-            if re.match(r'^\d+\.', def_text):
-                # Extract number and definition
-                match = re.match(r'^(\d+\.)\s*(.*)', def_text)
-                if match:
-                    number, text = match.groups()
-                    def_text = f"[bold green]{number}[/bold green] {text}"
+            def_text = f"[bold green]{number}[/bold green] {rest}" if number else rest
             
             # Highlight common Larousse indicators and markers
             def_text = highlight_larousse_indicators(def_text)
@@ -369,13 +455,28 @@ def get_definition(word):
         
         # Show expressions if available
         if expressions:
-            console.print("\n[bold cyan]Expressions:[/bold cyan]")
-            for expr in expressions:
-                console.print(f"  [yellow]•[/yellow] {expr}")
-        
+            lines = ["\n[bold cyan]Expressions:[/bold cyan]"]
+            lines.extend(f"  [yellow]•[/yellow] {expr}" for expr in expressions)
+            console.print("\n".join(lines))
+    
     except Exception as e:
         console.print(f"[bold red]❌ Erreur lors de l'analyse de la page: {e}[/bold red]")
 
+def batch_definitions(path):
+    """Show definitions for every word listed in a file (one per line, '-' for stdin)"""
+    try:
+        words = read_word_list(path)
+    except IOError as e:
+        console.print(f"[bold red]❌ Impossible de lire la liste de mots: {e}[/bold red]")
+        return
+    
+    # Fetch all uncached pages in parallel, then display sequentially
+    prefetch(lr_cache, [(word.lower(),) for word in words], download_page, PARSED_KEY,
+             errors=(LarousseError,))
+    for word in words:
+        console.rule(f"[bold cyan]{word}[/bold cyan]")
+        get_definition(word)
+
 def main():
     """Main function to handle command line arguments"""
     if len(sys.argv) < 2:
@@ -383,6 +484,7 @@ def main():
         console.print("\n[bold blue]Exemples:[/bold blue]")
         console.print("  lr maison")
         console.print("  lr courage")
+        console.print("  lr --batch mots.txt")
         console.print("  lr --cache-stats")
         console.print("  lr --clear-cache")
         return
@@ -397,6 +499,12 @@ def main():
     elif sys.argv[1] == '--cleanup-cache':
         cleanup_expired_all()
         return
+    elif sys.argv[1] == '--batch':
+        if len(sys.argv) < 3:
+            console.print("[bold red]❌ Utilisation: lr --batch <fichier>[/bold red]")
+            return
+        batch_definitions(sys.argv[2])
+        return
     
     word = sys.argv[1].strip()
     if not word:
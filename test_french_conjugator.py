@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the conjugator's command line: alias lookup, argument classification
+and dispatch to the display functions, run without verbecc or the daemon
+Run with: python -m unittest test_french_conjugator (or pytest)
+"""
+
+import importlib.util
+import io
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from rich.console import Console
+
+# The script's name has a hyphen, so it is loaded by path
+_spec = importlib.util.spec_from_file_location('french_conjugator', Path(__file__).with_name('french-conjugator-verbecc.py'))
+cj = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cj)
+
+DISPLAYS = ['display_all_conjugations', 'display_person_conjugations', 'display_specific_conjugation',
+            'display_impersonal_conjugation', 'display_batch', 'show_help']
+
+class NormalizeTest(unittest.TestCase):
+    def test_person(self):
+        self.assertEqual(cj.normalize_person('Elle'), 'il')
+        self.assertEqual(cj.normalize_person(" j' "), 'je')
+        self.assertIsNone(cj.normalize_person('moi'))
+    
+    def test_tense(self):
+        self.assertEqual(cj.normalize_tense('PC'), 'passé composé')
+        self.assertEqual(cj.normalize_tense('passe compose'), 'passé composé')
+        self.assertEqual(cj.normalize_tense('Gérondif'), 'participe présent')
+        self.assertIsNone(cj.normalize_tense('aimer'))
+    
+    def test_classify(self):
+        self.assertEqual(cj._classify('Nous'), ('P', 'nous'))
+        self.assertEqual(cj._classify('futur'), ('T', 'futur simple'))
+        self.assertEqual(cj._classify('Aimer'), ('V', 'Aimer'))
+
+class CommandLineTest(unittest.TestCase):
+    def setUp(self):
+        # Display functions are replaced by mocks; messages go to a buffer
+        self.displays = {}
+        for name in DISPLAYS:
+            patcher = mock.patch.object(cj, name)
+            self.displays[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+        self.output = io.StringIO()
+        patcher = mock.patch.object(cj, 'console', Console(file=self.output, width=200))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def run_cj(self, *args):
+        with mock.patch.object(cj.sys, 'argv', ['cj', *args]):
+            cj.run()
+    
+    def assert_called(self, name, *args):
+        self.displays[name].assert_called_once_with(*args)
+        for other, display in self.displays.items():
+            if other != name:
+                display.assert_not_called()
+    
+    def test_all_conjugations(self):
+        self.run_cj('aimer')
+        self.assert_called('display_all_conjugations', 'aimer', False)
+    
+    def test_plain_flag(self):
+        self.run_cj('aimer', '--plain')
+        self.assert_called('display_all_conjugations', 'aimer', True)
+    
+    def test_person_and_verb(self):
+        self.run_cj('tu', 'finir')
+        self.assert_called('display_person_conjugations', 'finir', 'tu')
+    
+    def test_person_verb_tense(self):
+        self.run_cj('Elles', 'venir', 'passé composé')
+        self.assert_called('display_specific_conjugation', 'venir', 'ils', 'passé composé')
+    
+    def test_verb_spelled_like_an_alias(self):
+        # Positions decide the roles: the second token is the verb
+        self.run_cj('je', 'p')
+        self.assert_called('display_person_conjugations', 'p', 'je')
+    
+    def test_verb_and_impersonal_tense(self):
+        self.run_cj('aimer', 'pp')
+        self.assert_called('display_impersonal_conjugation', 'aimer', 'participe passé')
+    
+    def test_tense_flag_is_folded(self):
+        self.run_cj('-PC', 'nous', 'aller')
+        self.assert_called('display_specific_conjugation', 'aller', 'nous', 'passé composé')
+    
+    def test_tense_flag_with_impersonal_tense(self):
+        self.run_cj('-pp', 'aimer')
+        self.assert_called('display_impersonal_conjugation', 'aimer', 'participe passé')
+    
+    def test_tense_flag_requires_person(self):
+        self.run_cj('-pc', 'aimer')
+        self.assertIn("requires a person. Use: cj -pc <person> <verb>", self.output.getvalue())
+        self.assertFalse(any(display.called for display in self.displays.values()))
+    
+    def test_batch_path_keeps_its_case(self):
+        self.run_cj('--BATCH=/Tmp/Verbes.txt', '--plain')
+        self.assert_called('display_batch', '/Tmp/Verbes.txt', True)
+    
+    def test_batch_with_verbs(self):
+        with self.assertRaises(cj.ConjError):
+            self.run_cj('--batch', 'verbes.txt', 'aimer')
+    
+    def test_command_word(self):
+        # Commands are looked up in the table built at import, not by name
+        command = mock.Mock()
+        with mock.patch.dict(cj.COMMANDS, {'help': command}):
+            self.run_cj('help')
+        command.assert_called_once_with()
+        self.assertFalse(any(display.called for display in self.displays.values()))
+    
+    def test_unknown_flag(self):
+        self.run_cj('-pz', 'je', 'aimer')
+        self.assertIn("Unknown tense flag: '-pz'", self.output.getvalue())
+        self.assertFalse(any(display.called for display in self.displays.values()))
+    
+    def test_unknown_person(self):
+        self.run_cj('moi', 'aimer', 'pc')
+        self.assertIn("Unknown person: 'moi'", self.output.getvalue())
+    
+    def test_unknown_tense(self):
+        self.run_cj('je', 'aimer', 'demain')
+        self.assertIn("Unknown tense: 'demain'", self.output.getvalue())
+    
+    def test_no_arguments(self):
+        with self.assertRaises(SystemExit):
+            self.run_cj()
+        self.assert_called('show_help')
+
+if __name__ == "__main__":
+    unittest.main()
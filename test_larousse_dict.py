@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for the Larousse page extractors, run offline on fixture text
+Run with: python -m unittest test_larousse_dict (or pytest)
+"""
+
+import importlib.util
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# The script's name has a hyphen, so it is loaded by path
+_spec = importlib.util.spec_from_file_location('larousse_dict', Path(__file__).with_name('larousse-dict.py'))
+larousse_dict = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(larousse_dict)
+
+class EtymologyTest(unittest.TestCase):
+    def test_preferred_pattern_inside_a_later_match(self):
+        # The étymologie: match spans the (latin ...) group, which still wins
+        text = 'étymologie: du bas (latin foo) bar. (de truc)'
+        self.assertEqual(larousse_dict.extract_etymology(text), 'latin foo')
+    
+    def test_noise_falls_through_to_next_pattern(self):
+        text = '(latin Newsletter) (du latin domus)'
+        self.assertEqual(larousse_dict.extract_etymology(text), 'du latin domus')
+    
+    def test_no_etymology(self):
+        self.assertIsNone(larousse_dict.extract_etymology('rien ici'))
+
+class GrammaticalInfoTest(unittest.TestCase):
+    def test_preferred_term_inside_a_later_one(self):
+        # "nom masculin" sits inside "pronom masculin" and is preferred to "pronom"
+        self.assertEqual(larousse_dict.extract_grammatical_info('pronom masculin'), 'n.m.')
+    
+    def test_labels(self):
+        self.assertEqual(larousse_dict.extract_grammatical_info('Nom féminin'), 'n.f.')
+        self.assertEqual(larousse_dict.extract_grammatical_info('adverbe'), 'v.')
+        self.assertEqual(larousse_dict.extract_grammatical_info('une interjection'), 'interjection')
+        self.assertIsNone(larousse_dict.extract_grammatical_info('rien'))
+
+# A trimmed Larousse entry page: chrome around <main>, numbered definitions with
+# a synonym, an expression section, and the etymology and word class in the text
+PAGE = """<html><head><title>maison</title><script>var nom_masculin = 1;</script></head><body>
+<header><ul><li>Newsletter et services du dictionnaire LAROUSSE</li></ul></header>
+<div class="sidebar"><ul><li>Une liste en marge qui ne compte pas du tout</li></ul></div>
+<main>
+  <p class="CatgramDefinition">nom féminin</p>
+  <p class="OrigineDefinition">(latin mansio, -onis, de manere, rester)</p>
+  <ul class="Definitions">
+    <li>1. Bâtiment servant d'habitation à une famille. <span class="syn">demeure</span></li>
+    <li>2. Entreprise commerciale ou industrielle. <span class="syn">firme</span> <span class="syn">firme</span></li>
+    <li>court</li>
+  </ul>
+  <section class="expressions">
+    <ul>
+      <li>Maison de campagne, résidence secondaire.</li>
+      <li>Hop</li>
+    </ul>
+  </section>
+</main>
+<footer><ul><li>Mentions légales et conditions générales</li></ul></footer>
+</body></html>"""
+
+class ExtractorsTest(unittest.TestCase):
+    def setUp(self):
+        # Parsed from UTF-8 bytes without <meta charset>, as the pages are cached
+        self.tree = larousse_dict.parse_page(PAGE.encode('utf-8'))
+    
+    def test_page_chrome_is_stripped(self):
+        text = self.tree.text_content()
+        self.assertNotIn('Newsletter', text)
+        self.assertNotIn('nom_masculin', text)
+        self.assertNotIn('en marge', text)
+        self.assertNotIn('Mentions', text)
+    
+    def test_definitions(self):
+        self.assertEqual(larousse_dict.extract_definitions(self.tree), [
+            {'text': "1. Bâtiment servant d'habitation à une famille. demeure", 'synonyms': ['demeure']},
+            {'text': '2. Entreprise commerciale ou industrielle. firme firme', 'synonyms': ['firme']},
+            {'text': 'Maison de campagne, résidence secondaire.', 'synonyms': []},
+        ])
+    
+    def test_numbered_paragraphs_without_lists(self):
+        tree = larousse_dict.parse_page(
+            '<main><p>1. Premier sens assez long du mot.</p><p>Sans numéro, pas une définition.</p></main>')
+        self.assertEqual(larousse_dict.extract_definitions(tree),
+                         [{'text': '1. Premier sens assez long du mot.', 'synonyms': []}])
+    
+    def test_expressions(self):
+        self.assertEqual(larousse_dict.extract_expressions(self.tree),
+                         ['Maison de campagne, résidence secondaire.'])
+    
+    def test_etymology_and_grammatical_info_from_page_text(self):
+        text = self.tree.text_content()
+        self.assertEqual(larousse_dict.extract_etymology(text), 'latin mansio, -onis, de manere, rester')
+        self.assertEqual(larousse_dict.extract_grammatical_info(text), 'n.f.')
+
+class FakeCache:
+    """In-memory stand-in for a ToolCache"""
+    def __init__(self, entries=None):
+        self.entries = dict(entries or {})
+    
+    def get(self, *args):
+        return self.entries.get(args)
+    
+    def set(self, data, *args):
+        self.entries[args] = data
+
+class LookupTest(unittest.TestCase):
+    def setUp(self):
+        larousse_dict.lookup.cache_clear()
+        self.addCleanup(larousse_dict.lookup.cache_clear)
+    
+    def use_cache(self, entries):
+        cache = FakeCache(entries)
+        patcher = mock.patch.object(larousse_dict, 'lr_cache', cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return cache
+    
+    def test_cached_page_is_extracted_and_entry_cached(self):
+        cache = self.use_cache({('maison',): PAGE.encode('utf-8')})
+        definitions, etymology, expressions, grammatical_info = larousse_dict.lookup('Maison')
+        self.assertEqual(len(definitions), 3)
+        self.assertEqual(etymology, 'latin mansio, -onis, de manere, rester')
+        self.assertEqual(expressions, ('Maison de campagne, résidence secondaire.',))
+        self.assertEqual(grammatical_info, 'n.f.')
+        self.assertEqual(cache.get('maison', larousse_dict.PARSED_KEY),
+                         (definitions, etymology, expressions, grammatical_info))
+    
+    def test_not_found_page_is_remembered(self):
+        cache = self.use_cache({('zzz',): b'<html><body><h1>Page non trouv\xc3\xa9e</h1></body></html>'})
+        with self.assertRaises(larousse_dict.WordNotFoundError):
+            larousse_dict.lookup('zzz')
+        self.assertEqual(cache.get('zzz', larousse_dict.PARSED_KEY), larousse_dict.NOT_FOUND_ENTRY)
+    
+    def test_404_in_page_text_is_not_remembered(self):
+        cache = self.use_cache({('erreur',): b'<html><body><main>Erreur 404</main></body></html>'})
+        with self.assertRaises(larousse_dict.WordNotFoundError):
+            larousse_dict.lookup('erreur')
+        self.assertIsNone(cache.get('erreur', larousse_dict.PARSED_KEY))
+
+if __name__ == "__main__":
+    unittest.main()
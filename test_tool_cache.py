@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared cache: caches left as a legacy JSON file by earlier versions
+Run with: python -m unittest test_tool_cache (or pytest)
+"""
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import tool_cache
+from tool_cache import ToolCache
+
+class LegacyOnlyCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.home = Path(self.tmp.name)
+        self.cache_dir = self.home / '.cache' / 'french-tools'
+        self.cache_dir.mkdir(parents=True)
+        # The helpers look the caches up under the home directory
+        patcher = mock.patch.object(Path, 'home', return_value=self.home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        
+        # Written the way earlier versions did: one JSON file and no database
+        self.legacy_file = self.cache_dir / 'conjugation.json'
+        self.legacy_file.write_text(json.dumps({
+            'k1': {'data': 'fresh', 'timestamp': time.time(), 'args': ['être']},
+            'k2': {'data': 'stale', 'timestamp': 0, 'args': ['avoir']}
+        }))
+    
+    def test_stats_count_legacy_entries(self):
+        stats = ToolCache('conjugation').get_stats()
+        self.assertEqual(stats['total_entries'], 2)
+        self.assertEqual(stats['expired_entries'], 1)
+        self.assertEqual(stats['file_size'], self.legacy_file.stat().st_size)
+        # Looking at the stats must not import or create anything
+        self.assertTrue(self.legacy_file.exists())
+        self.assertFalse((self.cache_dir / 'conjugation.db').exists())
+    
+    def test_clear_all_caches_removes_legacy_file(self):
+        tool_cache.clear_all_caches()
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        self.assertIsNone(ToolCache('conjugation').get('être'))
+    
+    def test_unreadable_legacy_file_is_cleared(self):
+        self.legacy_file.write_text('not json')
+        tool_cache.clear_all_caches()
+        self.assertFalse(self.legacy_file.exists())
+
+if __name__ == "__main__":
+    unittest.main()
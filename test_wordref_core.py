@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the WordReference page parser, run offline on fixture HTML
+Run with: python -m unittest test_wordref_core (or pytest)
+"""
+
+import unittest
+
+from wordref_core import ParseResult, Row, WordReferenceError, parse_wordref
+
+# A trimmed WordReference page: a header row, two entries, a row with too few
+# cells and the inflections line
+PAGE = """<html><head><title>bonjour</title></head><body>
+<div id="articleHead">Inflections of 'maison' (nf): <b>fpl:</b> maisons</div>
+<table class="other">
+  <tr><td><strong>leurre</strong></td><td>decoy</td><td>lure n</td></tr>
+</table>
+<table class="WRD clickblock">
+  <tr class="wrtopsection"><td colspan="3">Principales traductions</td></tr>
+  <tr><td>Français</td><td></td><td>Anglais</td></tr>
+  <tr class="even">
+    <td><strong>bonjour ⇒</strong> <em>interj</em></td>
+    <td>(salutation : le matin)</td>
+    <td>hello,   good morning interj</td>
+  </tr>
+  <tr class="odd">
+    <td><strong>bonjour</strong> <em>nm</em></td>
+    <td><i>(salut)</i></td>
+    <td>greeting</td>
+  </tr>
+  <tr><td><strong>ignoré</strong></td><td>deux cellules</td></tr>
+</table>
+</body></html>"""
+
+class ParseWordrefTest(unittest.TestCase):
+    def test_rows(self):
+        result = parse_wordref(PAGE)
+        self.assertIsInstance(result, ParseResult)
+        self.assertEqual(result.translations, (
+            Row('bonjour', 'interj', '(salutation : le matin)', 'hello, good morning', 'interj'),
+            Row('bonjour', 'nm', '(salut)', 'greeting', ''),
+        ))
+    
+    def test_rows_are_capped_at_eight(self):
+        rows = ''.join(f"<tr><td><strong>mot{i}</strong></td><td></td><td>word{i}</td></tr>" for i in range(12))
+        result = parse_wordref(f"<table class='WRD'>{rows}</table>")
+        self.assertEqual([row.target_term for row in result.translations], [f"word{i}" for i in range(8)])
+    
+    def test_inflections(self):
+        self.assertEqual(parse_wordref(PAGE).inflections, "Inflections of 'maison' (nf): fpl: maisons")
+    
+    def test_inflections_without_plural_forms(self):
+        page = PAGE.replace('<b>fpl:</b> maisons', 'aucune')
+        self.assertIsNone(parse_wordref(page).inflections)
+    
+    def test_page_without_translation_table(self):
+        self.assertIsNone(parse_wordref("<html><body><p>No translation found</p></body></html>"))
+    
+    def test_utf8_bytes_without_meta_charset(self):
+        page = "<table class='WRD'><tr><td><strong>été</strong></td><td></td><td>summer n</td></tr></table>"
+        result = parse_wordref(page.encode('utf-8'))
+        self.assertEqual(result.translations, (Row('été', '', '', 'summer', 'n'),))
+    
+    def test_unparseable_page(self):
+        with self.assertRaises(WordReferenceError):
+            parse_wordref(b'')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,17 +4,64 @@ Shared caching system for French language tools
 Provides persistent caching with size management and cleanup commands
 """
 
-import json
-import os
 import hashlib
+import json
+import pickle
+import sqlite3
 import time
+import zlib
 from pathlib import Path
 from rich.console import Console
-from rich.table import Table
-from rich import box
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+try:
+    import orjson  # Optional: faster import of legacy JSON cache files
+except ImportError:
+    orjson = None
 
 console = Console()
 
+# Cached values are pickled and, above a small size, compressed: with zstd when
+# zstandard is installed, with stdlib zlib otherwise. Pickles start with the
+# PROTO opcode (0x80), so the zstd frame magic or the zlib header byte (0x78)
+# tells the formats apart and caches survive installing/removing zstandard
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZLIB_MAGIC = b'\x78'
+# Short values such as a single conjugated form are stored uncompressed,
+# since a compression frame would cost more than it saves
+COMPRESS_MIN_SIZE = 1024
+_compressor = zstd.ZstdCompressor(level=3) if zstd else None
+_decompressor = zstd.ZstdDecompressor() if zstd else None
+
+def _dumps(data):
+    """Serialize a cache value"""
+    blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    if len(blob) < COMPRESS_MIN_SIZE:
+        return blob
+    if _compressor is not None:
+        return _compressor.compress(blob)
+    return zlib.compress(blob)
+
+def _loads(blob):
+    """Deserialize a cache value written by _dumps"""
+    if blob[:4] == ZSTD_MAGIC:
+        if _decompressor is None:
+            return None
+        try:
+            blob = _decompressor.decompress(blob)
+        except zstd.ZstdError:
+            return None
+    elif blob[:1] == ZLIB_MAGIC:
+        try:
+            blob = zlib.decompress(blob)
+        except zlib.error:
+            return None
+    return pickle.loads(blob)
+
 class ToolCache:
     def __init__(self, cache_name, cache_dir=None, max_age_days=30):
         """Initialize cache with name and optional directory"""
@@ -22,111 +69,181 @@ class ToolCache:
             cache_dir = Path.home() / '.cache' / 'french-tools'
         
         self.cache_dir = Path(cache_dir)
-        self.cache_file = self.cache_dir / f'{cache_name}.json'
+        self.cache_file = self.cache_dir / f'{cache_name}.db'
+        # JSON file written by earlier versions, imported on first use
+        self.legacy_file = self.cache_dir / f'{cache_name}.json'
         self.max_age = max_age_days * 24 * 3600  # Convert days to seconds
         
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
-        # Load existing cache
-        self._load_cache()
+        # SQLite connection, opened on first use
+        self._conn = None
+        self._legacy_checked = False
     
-    def _load_cache(self):
-        """Load cache from file"""
-        try:
-            if self.cache_file.exists():
-                with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    self.cache = json.load(f)
-            else:
-                self.cache = {}
-        except (json.JSONDecodeError, IOError):
-            self.cache = {}
-    
-    def _save_cache(self):
-        """Save cache to file"""
+    def _connect(self, import_legacy=False):
+        """Open the cache database, creating it if needed
+        
+        With import_legacy, entries from a legacy JSON cache file are moved
+        in first; only the owning tool does this, since expiry depends on
+        its max_age.
+        """
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.cache_file), isolation_level=None)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            # Commits append to the WAL without an fsync each; only checkpoints sync.
+            # A crash can lose the last few entries, which are refetched on the next miss
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries '
+                '(key TEXT PRIMARY KEY, expires INTEGER NOT NULL, value BLOB NOT NULL)'
+            )
+            # Expiry sweeps use the index instead of scanning every row
+            self._conn.execute('CREATE INDEX IF NOT EXISTS entries_expires ON entries (expires)')
+        if import_legacy and not self._legacy_checked:
+            self._legacy_checked = True
+            if self.legacy_file.exists():
+                self._import_legacy()
+        return self._conn
+    
+    def _import_legacy(self):
+        """Move unexpired entries from a legacy JSON cache file into the database"""
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(self.cache, f, ensure_ascii=False, indent=2)
-        except IOError as e:
-            console.print(f"[yellow]Warning: Could not save cache: {e}[/yellow]")
+            with open(self.legacy_file, 'rb') as f:
+                raw = f.read()
+            legacy = orjson.loads(raw) if orjson else json.loads(raw)
+            
+            now = time.time()
+            rows = []
+            for key, entry in legacy.items():
+                expires = int(entry['timestamp'] + self.max_age)
+                if expires < now:
+                    continue
+                # Re-derive the key from the stored arguments when they were kept
+                if 'args' in entry:
+                    key = self._generate_key(*entry['args'])
+                rows.append((key, expires, _dumps(entry['data'])))
+            
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO entries (key, expires, value) VALUES (?, ?, ?)', rows
+            )
+        except (IOError, ValueError, KeyError, TypeError, AttributeError, sqlite3.Error) as e:
+            console.print(f"[yellow]Warning: Could not import old cache file: {e}[/yellow]")
+            return
+        
+        self.legacy_file.unlink()
+    
+    def _close(self):
+        """Close the database connection if open"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def _files(self):
+        """Database file plus its WAL and shared-memory companions, and any legacy JSON file"""
+        return [self.cache_file,
+                self.cache_file.with_name(self.cache_file.name + '-wal'),
+                self.cache_file.with_name(self.cache_file.name + '-shm'),
+                self.legacy_file]
     
     def _generate_key(self, *args):
         """Generate cache key from arguments"""
+        # A lone word is already a short key, and SQLite takes any text as one
+        if len(args) == 1 and isinstance(args[0], str):
+            return args[0]
+        
         key_string = '|'.join(str(arg) for arg in args)
-        return hashlib.md5(key_string.encode('utf-8')).hexdigest()
-    
-    def _is_expired(self, timestamp):
-        """Check if cache entry is expired"""
-        return time.time() - timestamp > self.max_age
+        # blake2b is built in and cheaper to set up than md5 for short keys
+        return hashlib.blake2b(key_string.encode('utf-8'), digest_size=16).hexdigest()
     
     def get(self, *args):
         """Get cached result"""
         key = self._generate_key(*args)
         
-        if key in self.cache:
-            entry = self.cache[key]
+        try:
+            row = self._connect(import_legacy=True).execute(
+                'SELECT value, expires FROM entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            
+            value, expires = row
             
             # Check if entry is expired
-            if self._is_expired(entry['timestamp']):
-                del self.cache[key]
-                self._save_cache()
+            if expires < time.time():
+                self._conn.execute('DELETE FROM entries WHERE key = ?', (key,))
                 return None
             
-            return entry['data']
-        
-        return None
+            return _loads(value)
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            return None
     
     def set(self, data, *args):
         """Set cache entry"""
         key = self._generate_key(*args)
         
-        self.cache[key] = {
-            'data': data,
-            'timestamp': time.time(),
-            'args': args  # Store original args for debugging
-        }
-        
-        self._save_cache()
+        try:
+            self._connect(import_legacy=True).execute(
+                'INSERT OR REPLACE INTO entries (key, expires, value) VALUES (?, ?, ?)',
+                (key, int(time.time() + self.max_age), _dumps(data))
+            )
+        except sqlite3.Error as e:
+            console.print(f"[yellow]Warning: Could not save cache: {e}[/yellow]")
     
     def clear(self):
         """Clear all cache entries"""
-        self.cache = {}
-        if self.cache_file.exists():
-            self.cache_file.unlink()
+        self._close()
+        for path in self._files():
+            if path.exists():
+                path.unlink()
     
     def cleanup_expired(self):
         """Remove expired entries"""
-        expired_keys = []
-        current_time = time.time()
-        
-        for key, entry in self.cache.items():
-            if current_time - entry['timestamp'] > self.max_age:
-                expired_keys.append(key)
+        if not self.cache_file.exists():
+            return 0
         
-        for key in expired_keys:
-            del self.cache[key]
-        
-        if expired_keys:
-            self._save_cache()
-        
-        return len(expired_keys)
+        try:
+            cursor = self._connect().execute(
+                'DELETE FROM entries WHERE expires < ?', (int(time.time()),)
+            )
+            return cursor.rowcount
+        except sqlite3.Error:
+            return 0
+    
+    def _legacy_stats(self):
+        """Entry and expired counts of a legacy JSON cache file not yet imported"""
+        try:
+            with open(self.legacy_file, 'rb') as f:
+                raw = f.read()
+            legacy = orjson.loads(raw) if orjson else json.loads(raw)
+            now = time.time()
+            expired_count = sum(1 for entry in legacy.values() if entry['timestamp'] + self.max_age < now)
+            return len(legacy), expired_count
+        except (IOError, ValueError, KeyError, TypeError, AttributeError):
+            return 0, 0
     
     def get_stats(self):
         """Get cache statistics"""
-        if not self.cache:
-            return {
-                'total_entries': 0,
-                'file_size': 0,
-                'expired_entries': 0
-            }
+        total_count, expired_count = 0, 0
+        
+        if self.cache_file.exists():
+            try:
+                total_count, expired_count = self._connect().execute(
+                    'SELECT COUNT(*), COALESCE(SUM(expires < ?), 0) FROM entries', (int(time.time()),)
+                ).fetchone()
+            except sqlite3.Error:
+                pass
         
-        file_size = self.cache_file.stat().st_size if self.cache_file.exists() else 0
-        current_time = time.time()
-        expired_count = sum(1 for entry in self.cache.values() 
-                          if current_time - entry['timestamp'] > self.max_age)
+        # A legacy file is only imported by its own tool, so it may still be waiting
+        if self.legacy_file.exists():
+            legacy_count, legacy_expired = self._legacy_stats()
+            total_count += legacy_count
+            expired_count += legacy_expired
+        
+        file_size = sum(path.stat().st_size for path in self._files() if path.exists())
         
         return {
-            'total_entries': len(self.cache),
+            'total_entries': total_count,
             'file_size': file_size,
             'expired_entries': expired_count
         }
@@ -145,8 +262,37 @@ def format_size(size_bytes):
     
     return f"{size_bytes:.1f} {size_names[size_index]}"
 
+# Every tool's cache, with the name shown in the stats table
+CACHE_NAMES = {
+    'wordreference': 'WordReference',
+    'conjugation': 'Conjugation',
+    'larousse': 'Larousse',
+    'verbecc': 'VerbECC'
+}
+
+def _for_each_cache(action):
+    """Run action(cache) on every tool's cache concurrently; results follow CACHE_NAMES order
+    
+    Each cache is opened, used and closed in its own worker thread, since a
+    SQLite connection belongs to the thread that opened it.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    def run(cache_name):
+        cache = ToolCache(cache_name)
+        try:
+            return action(cache)
+        finally:
+            cache._close()
+    
+    with ThreadPoolExecutor(max_workers=len(CACHE_NAMES)) as executor:
+        return list(executor.map(run, CACHE_NAMES))
+
 def show_all_cache_stats():
     """Show statistics for all caches"""
+    from rich.table import Table
+    from rich import box
+    
     console.print(f"\n🗄️  [bold blue]French Tools Cache Statistics[/bold blue]")
     
     cache_dir = Path.home() / '.cache' / 'french-tools'
@@ -166,17 +312,9 @@ def show_all_cache_stats():
     total_expired = 0
     
     # Check each possible cache file
-    cache_files = {
-        'wordreference': 'WordReference',
-        'conjugation': 'Conjugation',
-        'larousse': 'Larousse',
-        'verbecc': 'VerbECC'
-    }
-    
-    for cache_name, display_name in cache_files.items():
-        cache = ToolCache(cache_name)
-        stats = cache.get_stats()
-        
+    all_stats = _for_each_cache(ToolCache.get_stats)
+    
+    for display_name, stats in zip(CACHE_NAMES.values(), all_stats):
         if stats['total_entries'] > 0:
             table.add_row(
                 display_name,
@@ -205,14 +343,14 @@ def clear_all_caches():
         console.print("[dim]No cache directory found[/dim]")
         return
     
-    cleared_count = 0
-    cache_files = ['wordreference', 'conjugation', 'larousse', 'verbecc']
-    
-    for cache_name in cache_files:
-        cache = ToolCache(cache_name)
-        if cache.cache:
+    def clear_if_used(cache):
+        # An unreadable legacy file counts no entries but still needs removing
+        if cache.get_stats()['total_entries'] > 0 or cache.legacy_file.exists():
             cache.clear()
-            cleared_count += 1
+            return True
+        return False
+    
+    cleared_count = sum(_for_each_cache(clear_if_used))
     
     if cleared_count > 0:
         console.print(f"[green]✅ Cleared {cleared_count} cache(s)[/green]")
@@ -227,13 +365,7 @@ def cleanup_expired_all():
         console.print("[dim]No cache directory found[/dim]")
         return
     
-    total_removed = 0
-    cache_files = ['wordreference', 'conjugation', 'larousse', 'verbecc']
-    
-    for cache_name in cache_files:
-        cache = ToolCache(cache_name)
-        removed = cache.cleanup_expired()
-        total_removed += removed
+    total_removed = sum(_for_each_cache(ToolCache.cleanup_expired))
     
     if total_removed > 0:
         console.print(f"[green]✅ Removed {total_removed} expired entries[/green]")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Shared network and input helpers for French language tools
+Provides the pooled HTTP session, page decoding and parsing, parallel
+prefetching into a ToolCache, and the word lists read by batch modes
+"""
+
+import atexit
+import codecs
+import sys
+
+# (connect, read) timeouts: an unreachable host fails fast, a slow page still loads
+REQUEST_TIMEOUT = (3, 10)
+# Parallel downloads used to fill a cache in batch mode
+BATCH_WORKERS = 8
+
+# One pooled session for every request, so repeated lookups reuse the connection.
+# Created on first use: importing requests dominates startup, and cached
+# lookups and cache commands never need it
+_session = None
+
+def get_session():
+    """Return the shared HTTP session, initializing it on first call"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.request import ACCEPT_ENCODING
+        from urllib3.util.retry import Retry
+        
+        _session = requests.Session()
+        _session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            # Every encoding urllib3 can decode here, which includes br once brotli is installed
+            'Accept-Encoding': ACCEPT_ENCODING
+        })
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=BATCH_WORKERS, max_retries=Retry(total=2, backoff_factor=0.3))
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+        atexit.register(_session.close)
+    return _session
+
+def utf8_body(response, body):
+    """The page body as UTF-8, transcoded when the response declares another charset"""
+    # Without a declared charset the body is taken as UTF-8, which is what both sites serve
+    content_type = response.headers.get('Content-Type', '').lower()
+    encoding = response.encoding if 'charset=' in content_type else 'utf-8'
+    try:
+        if codecs.lookup(encoding).name != 'utf-8':
+            return body.decode(encoding, 'replace').encode('utf-8')
+    except LookupError:
+        pass
+    return body
+
+# Pages are cached as UTF-8 bytes (see utf8_body) and the parser is told so, since
+# lxml would read a page without <meta charset> as Latin-1. Created on first use
+_page_parser = None
+
+def parse_html(content):
+    """Parse a cached page (UTF-8 bytes, or str cached by older versions) into an lxml.html tree"""
+    global _page_parser
+    from lxml import html
+    if _page_parser is None:
+        _page_parser = html.HTMLParser(encoding='utf-8')
+    return html.fromstring(content, parser=_page_parser)
+
+def prefetch(cache, keys, download, parsed_key, errors=()):
+    """Download every uncached page concurrently and store it in the cache
+    
+    Each key is a tuple of cache arguments, which download() takes as well.
+    Keys with an extracted entry cached under parsed_key need no page either.
+    """
+    missing = [key for key in dict.fromkeys(keys)
+               if not cache.get(*key) and not cache.get(*key, parsed_key)]
+    if not missing:
+        return
+    
+    import requests
+    from concurrent.futures import ThreadPoolExecutor
+    
+    failures = (requests.RequestException,) + tuple(errors)
+    
+    def fetch(key):
+        try:
+            return download(*key)
+        except failures:
+            return None
+    
+    # Only the downloads run in worker threads; the cache is written from this one.
+    # Failed keys are left to the normal path so their errors get reported.
+    # The session is created up front so the workers share one
+    get_session()
+    with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(missing))) as executor:
+        for key, content in zip(missing, executor.map(fetch, missing)):
+            if content:
+                cache.set(content, *key)
+
+def read_word_list(path):
+    """Words listed in a file, one per line ('-' reads stdin), skipping blank and '#' lines
+    
+    Raises IOError when the list cannot be read.
+    """
+    if path == '-':
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#')]
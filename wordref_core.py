@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+WordReference page parsing shared by the WordReference tools
+Turns a raw WordReference page into translation rows and the inflections line,
+with no network or cache access
+"""
+
+from collections import namedtuple
+from lxml import etree
+from tool_io import parse_html
+
+# Compiled XPath queries over the parsed page, each evaluated in libxml2
+# The translation table is the first one whose class list includes WRD
+TRANSLATION_TABLE_XPATH = etree.XPath(
+    "(//table[contains(concat(' ', normalize-space(@class), ' '), ' WRD ')])[1]")
+# Only rows with the three columns an entry needs are returned
+ROWS_XPATH = etree.XPath(".//tr[count(.//td) >= 3]")
+CELLS_XPATH = etree.XPath(".//td")
+# Text of the first <strong>/<em> in a cell; '' when there is none
+FIRST_STRONG_TEXT_XPATH = etree.XPath("string((.//strong)[1])")
+FIRST_EM_TEXT_XPATH = etree.XPath("string((.//em)[1])")
+INFLECTIONS_TEXT_XPATH = etree.XPath("(//text()[contains(., 'Inflections')])[1]")
+
+def clean_text(text):
+    """Clean and format text from HTML"""
+    if not text:
+        return ""
+    # Remove arrow symbols that link to conjugation pages
+    text = text.replace('⇒', '')
+    # Clean up multiple spaces
+    text = ' '.join(text.split())
+    return text
+
+def cell_text(element):
+    """All text inside an element; a cell without child elements is read directly"""
+    # text_content() runs an XPath string() query, which a lone text node doesn't need
+    if len(element):
+        return element.text_content()
+    return element.text or ''
+
+# Common grammatical types that appear at the end of a target translation
+GRAM_TYPES = frozenset({'interj', 'n', 'v', 'adj', 'adv', 'expr', 'prep', 'conj', 'det', 'nm', 'nf', 'npl', 'nmpl', 'nfpl'})
+
+class WordReferenceError(Exception):
+    """A lookup that cannot be displayed; the message is shown as-is"""
+
+# One translation row; a tuple underneath, so it stays small, pickles into the
+# cache and unpacks positionally like the plain tuples cached before it
+Row = namedtuple('Row', ['source_term', 'source_type', 'explanation', 'target_term', 'target_type'])
+
+# Everything shown for one WordReference page: the translation rows and the
+# inflections line (None when the page has none)
+ParseResult = namedtuple('ParseResult', ['translations', 'inflections'])
+
+def extract_translations(main_table):
+    """Extract up to 8 translation Rows"""
+    translations = []
+    
+    for row in ROWS_XPATH(main_table):
+        if len(translations) >= 8:  # Limit to main translations
+            break
+        
+        cells = CELLS_XPATH(row)
+        # Column 1: Source term + type
+        source_cell = cells[0]
+        
+        # Get the main source term
+        source_term = clean_text(FIRST_STRONG_TEXT_XPATH(source_cell))
+        
+        # Get the grammatical type - handle multi-word types like "loc adv"
+        source_type = clean_text(FIRST_EM_TEXT_XPATH(source_cell))
+        
+        # Column 2: Context/explanation
+        explanation = clean_text(cell_text(cells[1]))
+        
+        # Column 3: Target translations
+        target_text = clean_text(cell_text(cells[2]))
+        
+        # Only keep rows with the essential parts
+        if source_term and target_text:
+            # Split a grammatical type off the end of the target
+            target_parts = target_text.split()
+            if target_parts[-1] in GRAM_TYPES:
+                target_term = ' '.join(target_parts[:-1])
+                target_type = target_parts[-1]
+            else:
+                target_term = target_text
+                target_type = ""
+            
+            translations.append(Row(source_term, source_type, explanation, target_term, target_type))
+    
+    return translations
+
+def extract_inflections(tree):
+    """Extract the inflections line (plural forms), if the page has one"""
+    try:
+        inflection_strings = INFLECTIONS_TEXT_XPATH(tree)
+        if inflection_strings:
+            # The element holding the text; a tail string belongs to the enclosing one
+            inflection_string = inflection_strings[0]
+            parent = inflection_string.getparent()
+            if inflection_string.is_tail:
+                parent = parent.getparent()
+            if parent is not None:
+                inflection_text = clean_text(parent.text_content())
+                if "fpl:" in inflection_text or "mpl:" in inflection_text:
+                    return inflection_text
+    except Exception:
+        pass
+    return None
+
+def parse_wordref(content):
+    """Parse a raw WordReference page (UTF-8 bytes or str)
+    
+    Returns a ParseResult, or None when the page has no translation table.
+    """
+    try:
+        tree = parse_html(content)
+    except Exception as e:
+        raise WordReferenceError(f"Error parsing results: {e}") from e
+    
+    try:
+        # Find the main translation table
+        tables = TRANSLATION_TABLE_XPATH(tree)
+        if not tables:
+            return None
+        translations = extract_translations(tables[0])
+    except Exception as e:
+        raise WordReferenceError(f"Error processing results: {e}") from e
+    
+    return ParseResult(tuple(translations), extract_inflections(tree))